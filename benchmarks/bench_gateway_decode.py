@@ -0,0 +1,145 @@
+"""gateway payload 디코딩과 이벤트 dispatch 처리량을 측정합니다.
+
+봇의 기본 실행 환경(asyncio, zlib, discord.py가 선택한 JSON 디코더)과 `install_speedups()`를 적용한 환경을 비교합니다.
+orjson은 설치되어 있으면 discord.py가 두 환경 모두에서 사용합니다.
+payload는 Discord gateway처럼 하나의 zlib-stream으로 압축한 뒤 메시지 단위로 압축 해제, JSON 디코딩,
+`ConnectionState`의 parser로 dispatch합니다.
+
+`--payloads`로 기록해 둔 gateway 메시지(JSON Lines, 한 줄에 `{"op": 0, "t": ..., "d": ...}` 하나)를 지정할 수 있으며,
+지정하지 않으면 내장된 예시 payload를 사용합니다.
+
+실행:
+    python -m benchmarks.bench_gateway_decode --repeat 2000
+"""
+import discord
+import discord.gateway
+import discord.utils
+
+import argparse
+import asyncio
+import json
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils.speedups import install_speedups, uninstall_speedups
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+_USER = {"id": "80351110224678912", "username": "discraft", "global_name": "Discraft", "avatar": None, "discriminator": "0"}
+
+SAMPLE_PAYLOADS: list[dict[str, Any]] = [
+    {
+        "op": 0, "s": 1, "t": "MESSAGE_CREATE",
+        "d": {
+            "id": "1234567890123456789", "channel_id": "1111111111111111111", "guild_id": "2222222222222222222",
+            "author": _USER, "content": ";balance", "timestamp": "2024-12-01T12:00:00.000000+00:00",
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [],
+            "attachments": [], "embeds": [], "pinned": False, "type": 0, "flags": 0,
+            "member": {"roles": ["3333333333333333333"], "joined_at": "2024-01-01T00:00:00.000000+00:00", "deaf": False, "mute": False, "flags": 0},
+        },
+    },
+    {
+        "op": 0, "s": 2, "t": "TYPING_START",
+        "d": {"channel_id": "1111111111111111111", "user_id": _USER["id"], "timestamp": 1733054400},
+    },
+    {
+        "op": 0, "s": 3, "t": "MESSAGE_REACTION_ADD",
+        "d": {
+            "user_id": _USER["id"], "channel_id": "1111111111111111111", "message_id": "1234567890123456789",
+            "guild_id": "2222222222222222222", "emoji": {"id": None, "name": "👍"}, "burst": False, "type": 0,
+        },
+    },
+    {
+        "op": 0, "s": 4, "t": "MESSAGE_DELETE",
+        "d": {"id": "1234567890123456789", "channel_id": "1111111111111111111", "guild_id": "2222222222222222222"},
+    },
+]
+
+
+def load_payloads(path: Optional[Path]) -> list[dict[str, Any]]:
+    if path is None:
+        return SAMPLE_PAYLOADS
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compress_stream(payloads: list[dict[str, Any]], repeat: int) -> list[bytes]:
+    """payload를 gateway와 같은 zlib-stream 메시지로 압축합니다."""
+    compressor = zlib.compressobj()
+    messages = []
+    for _ in range(repeat):
+        for payload in payloads:
+            data = compressor.compress(json.dumps(payload).encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            messages.append(data)
+    return messages
+
+
+def decode(messages: list[bytes]) -> list[dict[str, Any]]:
+    """`DiscordWebSocket.received_message`와 같은 방식으로 압축 해제 후 디코딩합니다."""
+    inflator = discord.gateway.zlib.decompressobj()
+    from_json = discord.utils._from_json
+    buffer = bytearray()
+    decoded = []
+    for message in messages:
+        buffer.extend(message)
+        if len(message) < 4 or message[-4:] != ZLIB_SUFFIX:
+            continue
+        decoded.append(from_json(inflator.decompress(buffer)))
+        buffer = bytearray()
+    return decoded
+
+
+async def dispatch(messages: list[bytes]) -> int:
+    """압축 해제, 디코딩 후 `ConnectionState`의 parser로 이벤트를 처리합니다."""
+    client = discord.Client(intents=discord.Intents.default())
+    parsers = client._connection.parsers
+    count = 0
+    for payload in decode(messages):
+        parser = parsers.get(payload["t"])
+        if parser is not None:
+            parser(payload["d"])
+            count += 1
+
+    await asyncio.sleep(0) # dispatch된 이벤트 task 실행
+    await client.close()
+    return count
+
+
+def measure(messages: list[bytes]) -> tuple[float, float]:
+    """초당 디코딩 메시지 수, 초당 dispatch 메시지 수를 반환합니다."""
+    start = time.perf_counter()
+    decode(messages)
+    decode_rate = len(messages) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    asyncio.run(dispatch(messages))
+    dispatch_rate = len(messages) / (time.perf_counter() - start)
+
+    return decode_rate, dispatch_rate
+
+
+def main(payload_path: Optional[Path], repeat: int):
+    payloads = load_payloads(payload_path)
+    messages = compress_stream(payloads, repeat)
+    print(f"messages={len(messages)} ({sum(map(len, messages)) / 1024:.1f} KiB compressed)")
+    print(f"{'mode':<40}{'decode (msg/s)':>16}{'dispatch (msg/s)':>18}")
+
+    decode_rate, dispatch_rate = measure(messages)
+    json_decoder = "orjson" if discord.utils.HAS_ORJSON else "json"
+    print(f"{'default (' + json_decoder + ')':<40}{decode_rate:>16,.0f}{dispatch_rate:>18,.0f}")
+
+    active = install_speedups()
+    decode_rate, dispatch_rate = measure(messages)
+    print(f"{'speedups (' + (', '.join(active) or 'none') + ')':<40}{decode_rate:>16,.0f}{dispatch_rate:>18,.0f}")
+    uninstall_speedups()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=Path, default=None, help="기록된 gateway 메시지 파일 (JSON Lines)")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.payloads, args.repeat)
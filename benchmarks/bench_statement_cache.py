@@ -0,0 +1,153 @@
+"""Repository 핫 쿼리의 쿼리당 Python 오버헤드를 측정합니다.
+
+매 호출마다 `select(...).filter(...)`를 새로 생성하던 이전 방식(before)과
+모듈에 한 번만 정의한 statement를 사용하는 Repository 메서드(after)를 비교합니다.
+두 방식 모두 같은 SQLite 데이터베이스에 같은 쿼리를 보내므로 차이는 Python 쪽 오버헤드입니다.
+
+측정 순서에 따른 편향을 줄이기 위해 before/after를 번갈아 가며 `--rounds`회 측정하고 중앙값을 출력합니다.
+
+실행:
+    python -m benchmarks.bench_statement_cache --iterations 5000 --rounds 7
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import DiscraftDBConnection, UserInfo, AccountInfo, MinecraftPlayerInfo
+from src.database.session import Base
+from src.database.repositories import UserRepository
+
+ROWS = 1000
+
+
+async def seed(db: DiscraftDBConnection):
+    async with db.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with db.session_scope() as session:
+        for user_id in range(ROWS):
+            session.add(UserInfo(discord_user_id=user_id))
+            session.add(AccountInfo(discord_user_id=user_id, balance=0))
+            session.add(MinecraftPlayerInfo(discord_user_id=user_id, minecraft_username=f"player{user_id}"))
+
+
+async def measure(
+    db: DiscraftDBConnection,
+    iterations: int,
+    query: Callable[[AsyncSession, int], Awaitable[object]],
+) -> float:
+    """쿼리 1회당 평균 실행 시간(µs)을 반환합니다."""
+    async with db.session_scope(read_only=True) as session:
+        for i in range(100): # warm-up
+            await query(session, i % ROWS)
+
+        start = time.perf_counter()
+        for i in range(iterations):
+            await query(session, i % ROWS)
+        elapsed = time.perf_counter() - start
+
+    return elapsed / iterations * 1_000_000
+
+
+# 이전 방식: 호출마다 statement 생성
+async def inline_get_by_id(session: AsyncSession, i: int):
+    result = await session.execute(select(UserInfo).filter(UserInfo.discord_user_id == i))
+    return result.scalars().first()
+
+async def inline_get_by_mc_name(session: AsyncSession, i: int):
+    result = await session.execute(
+        select(UserInfo).filter(UserInfo.minecraft_player.has(minecraft_username=f"player{i}"))
+    )
+    return result.scalars().first()
+
+async def inline_get_all(session: AsyncSession, i: int):
+    result = await session.execute(select(UserInfo).offset(i % 10).limit(10))
+    return result.scalars().all()
+
+
+# 현재 방식: Repository의 캐시된 statement
+async def cached_get_by_id(session: AsyncSession, i: int):
+    return await UserRepository(session).get_by_id(i)
+
+async def cached_get_by_mc_name(session: AsyncSession, i: int):
+    return await UserRepository(session).get_by_mc_name(f"player{i}")
+
+async def cached_get_all(session: AsyncSession, i: int):
+    return await UserRepository(session).get_all(skip=i % 10, limit=10)
+
+
+QUERIES = {
+    "get_by_id": (inline_get_by_id, cached_get_by_id),
+    "get_by_mc_name": (inline_get_by_mc_name, cached_get_by_mc_name),
+    "get_all": (inline_get_all, cached_get_all),
+}
+
+
+async def compare(
+    db: DiscraftDBConnection,
+    iterations: int,
+    rounds: int,
+    before: Callable[[AsyncSession, int], Awaitable[object]],
+    after: Callable[[AsyncSession, int], Awaitable[object]],
+) -> tuple[list[float], list[float]]:
+    """before/after를 번갈아 `rounds`회 측정한 쿼리 1회당 평균 실행 시간(µs) 목록을 반환합니다.
+
+    매 라운드마다 먼저 실행하는 쪽을 바꾸어 캐시 예열이나 GC 시점이 한쪽에만 유리하지 않도록 합니다.
+    """
+    before_us, after_us = [], []
+    for i in range(rounds):
+        if i % 2 == 0:
+            before_us.append(await measure(db, iterations, before))
+            after_us.append(await measure(db, iterations, after))
+        else:
+            after_us.append(await measure(db, iterations, after))
+            before_us.append(await measure(db, iterations, before))
+    return before_us, after_us
+
+
+async def main(iterations: int, rounds: int, query_cache_size: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DiscraftDBConnection(
+            username=None,
+            password=None,
+            host=None,
+            port=None,
+            database=str(Path(tmp) / "bench.db"),
+            drivername="sqlite+aiosqlite",
+            query_cache_size=query_cache_size,
+        )
+        await db.initialize()
+        try:
+            await seed(db)
+
+            print(f"iterations={iterations}, rounds={rounds}, query_cache_size={query_cache_size} (median of rounds)")
+            print(f"{'query':<16}{'before (µs)':>14}{'after (µs)':>14}{'saved (µs)':>14}{'after faster':>14}")
+            for name, (before, after) in QUERIES.items():
+                before_us, after_us = await compare(db, iterations, rounds, before, after)
+                saved_us = [b - a for b, a in zip(before_us, after_us)]
+                faster = sum(saved > 0 for saved in saved_us)
+                print(
+                    f"{name:<16}{statistics.median(before_us):>14.1f}{statistics.median(after_us):>14.1f}"
+                    f"{statistics.median(saved_us):>14.1f}{f'{faster}/{rounds}':>14}"
+                )
+        finally:
+            await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--query-cache-size", type=int, default=500)
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+
+    asyncio.run(main(args.iterations, args.rounds, args.query_cache_size))
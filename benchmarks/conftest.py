@@ -0,0 +1,277 @@
+"""DB 계층 벤치마크 설정
+
+`--benchmark-rows`를 지정했을 때만 실행됩니다.
+
+실행:
+    python -m pytest benchmarks --benchmark-rows 10000,100000,1000000 --benchmark-json bench.json
+    python -m pytest benchmarks --benchmark-rows 10000 --benchmark-compare bench.json
+
+`--benchmark-db-url`로 로컬 MySQL을 지정할 수 있습니다. 해당 DB의 테이블은 삭제 후 다시 생성되므로 전용 DB를 사용해야 합니다.
+"""
+import json
+import math
+import platform
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.engine import make_url
+
+from src.database import DiscraftDBConnection, UserInfo, AccountInfo, MinecraftPlayerInfo
+from src.database.session import Base
+
+SEED_CHUNK_SIZE = 10_000
+BENCHMARK_DIR = Path(__file__).parent
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("benchmark", "DB 계층 벤치마크")
+    group.addoption("--benchmark-rows", default=None, help="쉼표로 구분된 시드 데이터 행 수 (예: 10000,100000,1000000)")
+    group.addoption("--benchmark-db-url", default=None, help="벤치마크에 사용할 DB URL. 기본값은 임시 SQLite 파일")
+    group.addoption("--benchmark-iterations", type=int, default=200, help="벤치마크당 최대 반복 횟수")
+    group.addoption("--benchmark-max-time", type=float, default=5.0, help="벤치마크당 최대 측정 시간(초)")
+    group.addoption("--benchmark-json", default=None, help="결과를 저장할 JSON 파일 경로")
+    group.addoption("--benchmark-compare", default=None, help="비교할 이전 결과 JSON 파일 경로")
+    group.addoption("--benchmark-max-regression", type=float, default=0.2, help="허용하는 평균 시간 증가 비율")
+
+
+def _rows(config: pytest.Config) -> list[int]:
+    rows = config.getoption("--benchmark-rows", default=None)
+    return [int(value) for value in rows.split(",")] if rows else []
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if _rows(config):
+        return
+    # tests/와 함께 실행해도 벤치마크만 건너뜀
+    skip = pytest.mark.skip(reason="--benchmark-rows를 지정해야 실행됩니다")
+    for item in items:
+        if item.path.is_relative_to(BENCHMARK_DIR):
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "rows" in metafunc.fixturenames:
+        rows = _rows(metafunc.config) or [0]
+        metafunc.parametrize("rows", rows, ids=[f"rows={value}" for value in rows], scope="session")
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 결과 (시간 단위: 초)"""
+    iterations: int
+    mean: float
+    p50: float
+    p99: float
+    min: float
+    max: float
+    ops_per_sec: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float], elapsed: Optional[float] = None) -> "BenchmarkResult":
+        ordered = sorted(samples)
+
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1)]
+
+        total = elapsed if elapsed is not None else sum(samples)
+        return cls(
+            iterations=len(samples),
+            mean=sum(samples) / len(samples),
+            p50=percentile(50),
+            p99=percentile(99),
+            min=ordered[0],
+            max=ordered[-1],
+            ops_per_sec=len(samples) / total if total else 0.0,
+        )
+
+
+class BenchmarkRecorder:
+    """벤치마크를 실행하고 결과를 모으는 클래스"""
+
+    def __init__(self, config: pytest.Config):
+        self.iterations = config.getoption("--benchmark-iterations", default=200)
+        self.max_time = config.getoption("--benchmark-max-time", default=5.0)
+        self.results: dict[str, BenchmarkResult] = {}
+        self.dialect: Optional[str] = None
+
+    async def measure(
+        self,
+        name: str,
+        func: Callable[[int], Awaitable[Any]],
+        setup: Optional[Callable[[int], Awaitable[Any]]] = None,
+        warmup: int = 5,
+    ) -> BenchmarkResult:
+        """`func(i)`를 반복 실행하여 시간을 측정합니다.
+
+        `--benchmark-iterations`회 또는 `--benchmark-max-time`초가 될 때까지 반복합니다.
+        `setup(i)`는 매 반복 전에 실행되며 측정 시간에 포함되지 않습니다.
+        """
+        for i in range(warmup):
+            if setup is not None:
+                await setup(-i - 1)
+            await func(-i - 1)
+
+        samples = []
+        deadline = time.perf_counter() + self.max_time
+        for i in range(self.iterations):
+            if setup is not None:
+                await setup(i)
+            started_at = time.perf_counter()
+            await func(i)
+            samples.append(time.perf_counter() - started_at)
+            if time.perf_counter() > deadline:
+                break
+
+        return self.record(name, samples)
+
+    def record(self, name: str, samples: list[float], elapsed: Optional[float] = None) -> BenchmarkResult:
+        """직접 측정한 시간(초)을 기록합니다.
+
+        Args:
+            name (str): 벤치마크 이름
+            samples (list[float]): 작업별 소요 시간
+            elapsed (Optional[float], optional): 처리량 계산에 사용할 전체 시간. Defaults to 소요 시간의 합.
+        """
+        result = self.results[name] = BenchmarkResult.from_samples(samples, elapsed)
+        return result
+
+    def to_json(self) -> dict[str, Any]:
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "commit": commit,
+            "created_at": int(time.time()),
+            "python": platform.python_version(),
+            "dialect": self.dialect,
+            "results": {name: asdict(result) for name, result in sorted(self.results.items())},
+        }
+
+
+recorder_key = pytest.StashKey[BenchmarkRecorder]()
+regressions_key = pytest.StashKey[list[str]]()
+
+
+def pytest_configure(config: pytest.Config):
+    config.stash[recorder_key] = BenchmarkRecorder(config)
+    config.stash[regressions_key] = []
+
+
+@pytest.fixture(scope="session")
+def bench(pytestconfig: pytest.Config) -> BenchmarkRecorder:
+    return pytestconfig.stash[recorder_key]
+
+
+async def seed(db: DiscraftDBConnection, rows: int):
+    """user_info, account_info, minecraft_player_info에 `rows`개씩 데이터를 넣습니다.
+
+    discord_user_id는 1부터 `rows`까지, minecraft_username은 `player{id}`입니다.
+    """
+    async with db.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        for start in range(1, rows + 1, SEED_CHUNK_SIZE):
+            ids = range(start, min(start + SEED_CHUNK_SIZE, rows + 1))
+            await conn.execute(insert(UserInfo), [{"discord_user_id": i} for i in ids])
+            await conn.execute(
+                insert(AccountInfo),
+                [{"discord_user_id": i, "balance": i % 1000, "last_check_in": 0} for i in ids],
+            )
+            await conn.execute(
+                insert(MinecraftPlayerInfo),
+                [{"discord_user_id": i, "minecraft_username": f"player{i}", "last_updated_at": 0} for i in ids],
+            )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def database(rows: int, pytestconfig: pytest.Config, bench: BenchmarkRecorder):
+    """`rows`개의 데이터가 들어 있는 DB 연결"""
+    db_url = pytestconfig.getoption("--benchmark-db-url")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = make_url(db_url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        db = DiscraftDBConnection(
+            username=url.username,
+            password=url.password,
+            host=url.host,
+            port=url.port,
+            database=url.database,
+            drivername=url.drivername,
+        )
+        await db.initialize()
+        bench.dialect = db.engine.dialect.name
+        try:
+            await seed(db, rows)
+            yield db
+        finally:
+            await db.close()
+
+
+def compare(results: dict[str, BenchmarkResult], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """이전 결과보다 평균 시간이 `max_regression` 비율 이상 늘어난 벤치마크를 반환합니다."""
+    regressions = []
+    for name, result in sorted(results.items()):
+        previous = baseline["results"].get(name)
+        if previous is None or previous["mean"] == 0:
+            continue
+        ratio = result.mean / previous["mean"]
+        if ratio > 1 + max_regression:
+            regressions.append(
+                f"{name}: {previous['mean'] * 1000:.3f}ms -> {result.mean * 1000:.3f}ms ({ratio - 1:+.1%})"
+            )
+    return regressions
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
+    config = session.config
+    recorder = config.stash[recorder_key]
+    if not recorder.results:
+        return
+
+    output = config.getoption("--benchmark-json", default=None)
+    if output:
+        Path(output).write_text(json.dumps(recorder.to_json(), indent=2), encoding="utf-8")
+
+    baseline_path = config.getoption("--benchmark-compare", default=None)
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        regressions = compare(recorder.results, baseline, config.getoption("--benchmark-max-regression"))
+        config.stash[regressions_key] = regressions
+        if regressions and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config):
+    recorder = config.stash[recorder_key]
+    if not recorder.results:
+        return
+
+    terminalreporter.section("DB benchmark")
+    terminalreporter.write_line(f"{'name':<72}{'iters':>7}{'mean (ms)':>12}{'p99 (ms)':>12}{'ops/s':>12}")
+    for name, result in sorted(recorder.results.items()):
+        terminalreporter.write_line(
+            f"{name:<72}{result.iterations:>7}{result.mean * 1000:>12.3f}"
+            f"{result.p99 * 1000:>12.3f}{result.ops_per_sec:>12.1f}"
+        )
+
+    output = config.getoption("--benchmark-json", default=None)
+    if output:
+        terminalreporter.write_line(f"Saved benchmark results to {output}")
+
+    baseline_path = config.getoption("--benchmark-compare", default=None)
+    if baseline_path:
+        regressions = config.stash[regressions_key]
+        terminalreporter.write_line(f"Compared with {baseline_path}: {len(regressions)} regressions")
+        for message in regressions:
+            terminalreporter.write_line(f"REGRESSION {message}", red=True)
@@ -0,0 +1,181 @@
+"""Repository, 세션, 커넥션 풀 벤치마크
+
+`conftest.py`의 `database` fixture가 `--benchmark-rows`로 지정한 크기만큼 데이터를 넣은 DB를 제공하며,
+각 벤치마크의 결과는 `{대상}.{메서드}[rows=N]` 이름으로 기록됩니다.
+"""
+import asyncio
+import itertools
+import random
+import time
+
+import pytest
+from sqlalchemy import text
+
+from src.database import DiscraftDBConnection, UserInfo, AccountInfo, MinecraftPlayerInfo, Priority
+from src.database.repositories import UserRepository, AccountRepository, MinecraftPlayerRepository
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+REPOSITORIES = {
+    "user": UserRepository,
+    "account": AccountRepository,
+    "minecraft_player": MinecraftPlayerRepository,
+}
+
+CONCURRENCY = [1, 10, 50]
+OPERATIONS_PER_TASK = 20
+
+# 쓰기 벤치마크에서 새로 추가하는 discord 사용자 ID (시드 데이터와 겹치지 않도록 큰 값부터 시작)
+_new_ids = itertools.count(10 ** 12)
+
+
+def new_entity(name: str, user_id: int):
+    if name == "user":
+        return UserInfo(discord_user_id=user_id)
+    if name == "account":
+        return AccountInfo(discord_user_id=user_id, balance=0, last_check_in=0)
+    return MinecraftPlayerInfo(discord_user_id=user_id, minecraft_username=f"n{user_id % 10 ** 12}", last_updated_at=0)
+
+
+@pytest.mark.parametrize("name", REPOSITORIES)
+async def test_get_by_id(name: str, rows: int, database: DiscraftDBConnection, bench):
+    rng = random.Random(0)
+
+    async def get_by_id(_):
+        async with database.session_scope(read_only=True) as session:
+            await REPOSITORIES[name](session).get_by_id(rng.randint(1, rows))
+
+    await bench.measure(f"{name}.get_by_id[rows={rows}]", get_by_id)
+
+
+@pytest.mark.parametrize("name", REPOSITORIES)
+@pytest.mark.parametrize("offset", ["first", "middle"])
+async def test_get_all(name: str, offset: str, rows: int, database: DiscraftDBConnection, bench):
+    skip = 0 if offset == "first" else rows // 2
+
+    async def get_all(_):
+        async with database.session_scope(read_only=True) as session:
+            await REPOSITORIES[name](session).get_all(skip=skip, limit=100)
+
+    await bench.measure(f"{name}.get_all.{offset}[rows={rows}]", get_all)
+
+
+@pytest.mark.parametrize("name", REPOSITORIES)
+async def test_add(name: str, rows: int, database: DiscraftDBConnection, bench):
+    user_id = 0
+
+    async def setup(_):
+        nonlocal user_id
+        user_id = next(_new_ids)
+        if name != "user":
+            async with database.session_scope() as session:
+                UserRepository(session).add(UserInfo(discord_user_id=user_id))
+
+    async def add(_):
+        async with database.session_scope() as session:
+            REPOSITORIES[name](session).add(new_entity(name, user_id))
+
+    await bench.measure(f"{name}.add[rows={rows}]", add, setup=setup)
+
+
+@pytest.mark.parametrize("name", REPOSITORIES)
+async def test_update(name: str, rows: int, database: DiscraftDBConnection, bench):
+    rng = random.Random(0)
+    entity = None
+
+    async def setup(_):
+        nonlocal entity
+        async with database.session_scope(read_only=True) as session:
+            entity = await REPOSITORIES[name](session).get_by_id(rng.randint(1, rows))
+        if isinstance(entity, AccountInfo):
+            entity.balance += 1
+        elif isinstance(entity, MinecraftPlayerInfo):
+            entity.last_updated_at += 1
+
+    async def update(_):
+        async with database.session_scope() as session:
+            await REPOSITORIES[name](session).update(entity)
+
+    await bench.measure(f"{name}.update[rows={rows}]", update, setup=setup)
+
+
+@pytest.mark.parametrize("name", REPOSITORIES)
+async def test_delete(name: str, rows: int, database: DiscraftDBConnection, bench):
+    entity = None
+
+    async def setup(_):
+        nonlocal entity
+        user_id = next(_new_ids)
+        entity = new_entity(name, user_id)
+        async with database.session_scope() as session:
+            if name != "user":
+                UserRepository(session).add(UserInfo(discord_user_id=user_id))
+            REPOSITORIES[name](session).add(entity)
+
+    async def delete(_):
+        async with database.session_scope() as session:
+            await REPOSITORIES[name](session).delete(await session.merge(entity, load=False))
+
+    await bench.measure(f"{name}.delete[rows={rows}]", delete, setup=setup)
+
+
+async def test_get_by_mc_name(rows: int, database: DiscraftDBConnection, bench):
+    rng = random.Random(0)
+
+    async def get_by_mc_name(_):
+        async with database.session_scope(read_only=True) as session:
+            await UserRepository(session).get_by_mc_name(f"player{rng.randint(1, rows)}")
+
+    await bench.measure(f"user.get_by_mc_name[rows={rows}]", get_by_mc_name)
+
+
+@pytest.mark.parametrize("read_only", [False, True], ids=["write", "read_only"])
+async def test_session_scope_overhead(read_only: bool, rows: int, database: DiscraftDBConnection, bench):
+    """쿼리 없이 세션을 열고 닫는 비용"""
+    async def session_scope(_):
+        async with database.session_scope(read_only=read_only):
+            pass
+
+    mode = "read_only" if read_only else "write"
+    await bench.measure(f"session_scope.{mode}[rows={rows}]", session_scope)
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+@pytest.mark.parametrize("via", ["engine", "session_scope"])
+async def test_pool_checkout(
+    via: str,
+    concurrency: int,
+    rows: int,
+    database: DiscraftDBConnection,
+    bench,
+):
+    """`concurrency`개의 task가 동시에 커넥션을 얻어 `SELECT 1`을 실행할 때의 지연 시간과 처리량
+
+    engine은 커넥션 풀에서 직접, session_scope는 우선순위 스케줄러를 거쳐 커넥션을 얻습니다.
+    """
+    samples: list[float] = []
+
+    async def checkout():
+        started_at = time.perf_counter()
+        if via == "engine":
+            async with database.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        else:
+            async with database.session_scope(priority=Priority.INTERACTIVE) as session:
+                await session.execute(text("SELECT 1"))
+        samples.append(time.perf_counter() - started_at)
+
+    async def worker():
+        for _ in range(OPERATIONS_PER_TASK):
+            await checkout()
+
+    await worker() # warmup
+    samples.clear()
+
+    started_at = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(concurrency):
+            tg.create_task(worker())
+    elapsed = time.perf_counter() - started_at
+
+    bench.record(f"pool_checkout.{via}.concurrency={concurrency}[rows={rows}]", samples, elapsed)
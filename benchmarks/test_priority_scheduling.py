@@ -0,0 +1,131 @@
+"""백그라운드 작업이 실행 중일 때 사용자 명령어의 DB 지연 시간 벤치마크
+
+커넥션을 오래 점유하는 백그라운드 작업을 동시에 실행하면서 사용자 명령어의 `session_scope` + 쿼리 지연 시간을 측정합니다.
+
+- idle: 백그라운드 작업 없음
+- background: 백그라운드 작업을 `Priority.BACKGROUND`로 실행
+- unprioritized: 백그라운드 작업을 `Priority.INTERACTIVE`로 실행 (우선순위 스케줄링이 없을 때와 같음)
+
+세 시나리오를 번갈아 가며 `ROUNDS`회 실행하고, 라운드별 p99의 중앙값이 다음 중 하나라도 만족하지 않으면 실패합니다.
+
+- background의 사용자 명령어 전체 지연 시간 p99가 idle p99 + `INTERACTIVE_P99_SLACK` 이하
+- background의 사용자 명령어 커넥션 대기 시간 p99가 idle p99 + `INTERACTIVE_WAIT_SLACK` 이하
+
+우선순위 스케줄링이 없으면 사용자 명령어는 백그라운드 작업이 커넥션을 반환할 때까지(`BACKGROUND_HOLD`) 기다리므로,
+전체 지연 시간의 허용 범위는 그보다 작게 잡습니다. 그 이하의 증가는 백그라운드 작업의 쿼리 처리에 따른
+CPU 경합(SQLite는 같은 프로세스에서 실행됨)이며 스케줄링으로 해결할 수 없으므로 허용합니다.
+백그라운드 작업은 커넥션을 오래 점유하고 쿼리는 적게 실행하도록 하여 이 경합을 줄이고,
+한 라운드가 일시적인 부하로 느려져도 결과가 바뀌지 않도록 중앙값을 비교합니다.
+unprioritized 시나리오는 이 기준을 넘는지 확인하여 벤치마크가 커넥션 경합을 재현하는지 검증합니다.
+"""
+import asyncio
+import random
+import statistics
+import time
+
+import pytest
+from sqlalchemy import text
+
+from src.database import DiscraftDBConnection, Priority
+from src.database.repositories import UserRepository
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+BACKGROUND_WORKERS = 30
+BACKGROUND_HOLD = 0.2
+INTERACTIVE_REQUESTS = 300
+INTERACTIVE_INTERVAL = 0.002
+ROUNDS = 5
+
+# background 시나리오에서 허용하는 사용자 명령어 지연 시간 p99 증가량(초)
+INTERACTIVE_P99_SLACK = BACKGROUND_HOLD / 2
+INTERACTIVE_WAIT_SLACK = 0.001
+
+
+async def background_job(db: DiscraftDBConnection, priority: Priority, stop: asyncio.Event):
+    """커넥션을 `BACKGROUND_HOLD`초 동안 점유하는 bulk 작업"""
+    while not stop.is_set():
+        async with db.session_scope(priority=priority) as session:
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(BACKGROUND_HOLD)
+
+
+async def interactive_requests(db: DiscraftDBConnection, rows: int) -> list[float]:
+    """사용자 명령어처럼 짧은 조회를 `INTERACTIVE_INTERVAL` 간격으로 실행하고 지연 시간(초)을 반환합니다."""
+    rng = random.Random(0)
+    latencies = []
+
+    async def request(user_id: int):
+        started_at = time.perf_counter()
+        async with db.session_scope(priority=Priority.INTERACTIVE) as session:
+            await UserRepository(session).get_by_id(user_id)
+        latencies.append(time.perf_counter() - started_at)
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(INTERACTIVE_REQUESTS):
+            tg.create_task(request(rng.randint(1, rows)))
+            await asyncio.sleep(INTERACTIVE_INTERVAL)
+    return latencies
+
+
+async def run_scenario(db: DiscraftDBConnection, rows: int, background_priority: Priority | None) -> list[float]:
+    stop = asyncio.Event()
+    jobs = []
+    if background_priority is not None:
+        jobs = [asyncio.create_task(background_job(db, background_priority, stop)) for _ in range(BACKGROUND_WORKERS)]
+        await asyncio.sleep(BACKGROUND_HOLD) # 백그라운드 작업이 커넥션을 점유할 때까지 대기
+
+    try:
+        return await interactive_requests(db, rows)
+    finally:
+        stop.set()
+        await asyncio.gather(*jobs)
+
+
+def p99_of(samples: list[float]) -> float:
+    return statistics.quantiles(samples, n=100)[98]
+
+
+async def test_interactive_latency_under_background_load(rows: int, database: DiscraftDBConnection, bench):
+    scenarios = {
+        "idle": None,
+        "background": Priority.BACKGROUND,
+        "unprioritized": Priority.INTERACTIVE,
+    }
+    scheduler = database.schedulers[database.engine]
+
+    latencies: dict[str, list[float]] = {name: [] for name in scenarios}
+    waits: dict[str, list[float]] = {name: [] for name in scenarios}
+    round_p99: dict[str, list[float]] = {name: [] for name in scenarios}
+    round_wait_p99: dict[str, list[float]] = {name: [] for name in scenarios}
+    for _ in range(ROUNDS):
+        for name, priority in scenarios.items():
+            scheduler.reset_stats()
+            samples = await run_scenario(database, rows, priority)
+            wait_samples = scheduler.stats[Priority.INTERACTIVE].samples
+            latencies[name].extend(samples)
+            waits[name].extend(wait_samples)
+            round_p99[name].append(p99_of(samples))
+            round_wait_p99[name].append(p99_of(wait_samples))
+
+    for name in scenarios:
+        bench.record(f"priority_scheduling.interactive.{name}[rows={rows}]", latencies[name])
+        bench.record(f"priority_scheduling.interactive_wait.{name}[rows={rows}]", waits[name])
+
+    p99 = {name: statistics.median(values) for name, values in round_p99.items()}
+    wait_p99 = {name: statistics.median(values) for name, values in round_wait_p99.items()}
+
+    limit = p99["idle"] + INTERACTIVE_P99_SLACK
+    assert p99["unprioritized"] > limit, "background jobs did not contend for connections"
+    assert p99["background"] <= limit, (
+        f"median interactive p99 with background load {p99['background'] * 1000:.2f}ms "
+        f"exceeds idle p99 + slack ({limit * 1000:.2f}ms), rounds: "
+        + ", ".join(f"{value * 1000:.2f}ms" for value in round_p99["background"])
+    )
+
+    wait_limit = wait_p99["idle"] + INTERACTIVE_WAIT_SLACK
+    assert wait_p99["background"] <= wait_limit, (
+        f"median interactive connection wait p99 with background load {wait_p99['background'] * 1000:.2f}ms "
+        f"exceeds idle p99 + slack ({wait_limit * 1000:.2f}ms), rounds: "
+        + ", ".join(f"{value * 1000:.2f}ms" for value in round_wait_p99["background"])
+    )
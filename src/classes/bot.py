@@ -7,6 +7,10 @@ from pathlib import Path
 
 from src.config import ENV
 from src.classes.errors import NotRegisteredUser
+from src.classes.interaction import InteractionStats
+from src.classes.watchdog import LoopLagWatchdog
+from src.database import DiscraftDBConnection, DatabaseUnavailableError
+from src.database.journal import EconomyWriter, WriteJournal
 
 # https://github.com/AlexFlipnote/discord_bot.py/blob/master/utils/data.py
 
@@ -29,7 +33,32 @@ class Bot(commands.Bot):
             help_command=commands.DefaultHelpCommand(),
         )
 
+        # DB 연결 설정
+        self.database = DiscraftDBConnection(
+            username=ENV.MYSQL_USER,
+            password=ENV.MYSQL_PASSWORD,
+            host=ENV.MYSQL_HOST,
+            port=ENV.MYSQL_PORT,
+            database=ENV.MYSQL_DATABASE,
+            replica_urls=[url.strip() for url in (ENV.MYSQL_REPLICA_URLS or "").split(",") if url.strip()],
+        )
+
+        # DB 장애 중 경제 관련 쓰기를 보관할 journal
+        self.economy = EconomyWriter(self.database, WriteJournal("./data/economy_journal.jsonl"))
+
+        # 앱 커맨드 응답 통계
+        self.interaction_stats = InteractionStats()
+
+        # 이벤트 루프 지연 감시
+        self.watchdog = LoopLagWatchdog()
+
     async def setup_hook(self):
+        self.watchdog.start()
+
+        # DB 연결
+        await self.database.initialize()
+        self.economy.start() # 이전 실행에서 반영하지 못한 쓰기 반영
+
         # Cog 로드
         def task_finish_callback(task: asyncio.Task[None], name: str):
             try:
@@ -82,6 +111,8 @@ class Bot(commands.Bot):
         await self.process_commands(message) # 명령어 처리
 
     async def on_command_error(self, ctx: commands.Context["Bot"], error: commands.CommandError):
+        self.watchdog.track(f"on_command_error ({ctx.command})")
+
         if isinstance(error, (
             commands.CommandNotFound, # 명령어가 없을 때
             commands.NotOwner         # 관리자 명령어를 호출했을 때
@@ -98,6 +129,10 @@ class Bot(commands.Bot):
             return
 
         elif isinstance(error, commands.CommandInvokeError):
+            if isinstance(error.original, DatabaseUnavailableError):
+                await ctx.reply("데이터베이스에 연결할 수 없습니다. 잠시 후 다시 시도해 주세요.")
+                return
+
             if isinstance(error.original, discord.NotFound):
                 await ctx.reply("오류가 발생했습니다.")
                 self.logger.warning(error.original.args[0])
@@ -112,8 +147,9 @@ class Bot(commands.Bot):
             ), exc_info=error)
 
     async def close(self):
-        # if self.database is not None:
-        #     await self.database.close()
+        await self.watchdog.stop()
+        await self.economy.close()
+        await self.database.close()
         await super().close()
 
 
@@ -131,6 +167,7 @@ class Cog(commands.Cog):
 
     # 명령어가 실행되기 전 실행되는 함수
     async def cog_before_invoke(self, ctx: commands.Context[Bot]):
+        self.bot.watchdog.track(f"{ctx.command} (User: {ctx.author.id})")
         self.logger.debug(
             f"Command invoked | "
             f"User: {ctx.author} (ID: {ctx.author.id}) | "
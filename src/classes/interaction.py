@@ -0,0 +1,269 @@
+import discord
+
+import asyncio
+import functools
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Optional, Sequence
+
+from src.database import DatabaseUnavailableError
+
+logger = logging.getLogger("discord.classes.interaction")
+
+# Discord는 3초 안에 interaction 응답을 받지 못하면 실패로 처리하므로 여유를 둡니다.
+DEFAULT_LATENCY_BUDGET = 2.0
+
+RESPONDER_KEY = "responder"
+
+# defer한 커맨드가 아무 메시지도 보내지 않고 끝났을 때 "생각하는 중..." 대신 표시할 메시지
+DONE_MESSAGE = "완료되었습니다."
+ERROR_MESSAGE = "오류가 발생했습니다."
+DATABASE_UNAVAILABLE_MESSAGE = "데이터베이스에 연결할 수 없습니다. 잠시 후 다시 시도해 주세요."
+
+
+@dataclass
+class InteractionStats:
+    """앱 커맨드 응답 통계
+
+    Attributes:
+        invoked (int): `auto_defer`로 감싼 앱 커맨드 실행 횟수
+        deferred (int): 응답 시간 제한을 넘겨 자동으로 defer한 횟수
+        messages (int): 보내려고 요청한 메시지 수
+        rest_calls (int): 실제로 호출한 응답 REST API 횟수
+    """
+    invoked: int = 0
+    deferred: int = 0
+    messages: int = 0
+    rest_calls: int = 0
+
+    @property
+    def deferral_rate(self) -> float:
+        """자동 defer 비율"""
+        return self.deferred / self.invoked if self.invoked else 0.0
+
+
+class InteractionResponder:
+    """interaction 응답을 모아서 보내는 클래스
+
+    `send()`로 요청한 메시지는 버퍼에 쌓였다가 `flush()`될 때 가능한 적은 수의 REST 호출로 합쳐서 전송됩니다.
+    응답 전이면 interaction 응답으로, 이미 응답(또는 defer)했으면 followup 메시지로 전송합니다.
+
+    Attributes:
+        sent (bool): 메시지를 하나라도 전송했는지 여부
+    """
+
+    MAX_CONTENT_LENGTH = 2000
+    MAX_EMBEDS = 10
+
+    def __init__(
+        self,
+        interaction: discord.Interaction,
+        *,
+        ephemeral: bool = False,
+        stats: Optional[InteractionStats] = None,
+    ):
+        self.interaction = interaction
+        self.ephemeral = ephemeral
+        self.stats = stats
+
+        self._contents: list[str] = []
+        self._content_length = 0
+        self._embeds: list[discord.Embed] = []
+        self.sent = False
+
+    async def send(
+        self,
+        content: Optional[str] = None,
+        *,
+        embed: Optional[discord.Embed] = None,
+        embeds: Sequence[discord.Embed] = (),
+    ):
+        """|coro|
+
+        메시지를 버퍼에 추가합니다.
+
+        버퍼에 더 이상 합칠 수 없으면 기존 버퍼를 먼저 전송합니다.
+
+        Args:
+            content (Optional[str], optional): 메시지 내용. Defaults to None.
+            embed (Optional[discord.Embed], optional): 임베드. Defaults to None.
+            embeds (Sequence[discord.Embed], optional): 임베드 목록. Defaults to ().
+        """
+        if self.stats is not None:
+            self.stats.messages += 1
+
+        new_embeds = [embed] if embed is not None else []
+        new_embeds.extend(embeds)
+        for chunk in self._split_content(content):
+            if self._content_length + len(chunk) + len(self._contents) > self.MAX_CONTENT_LENGTH:
+                await self.flush()
+            self._contents.append(chunk)
+            self._content_length += len(chunk)
+
+        for new_embed in new_embeds:
+            if len(self._embeds) >= self.MAX_EMBEDS:
+                await self.flush()
+            self._embeds.append(new_embed)
+
+    async def defer(self):
+        """|coro|
+
+        아직 응답하지 않았다면 interaction을 defer합니다.
+        """
+        if self.interaction.response.is_done():
+            return
+
+        await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True)
+        if self.stats is not None:
+            self.stats.deferred += 1
+            self.stats.rest_calls += 1
+
+    async def flush(self):
+        """|coro|
+
+        버퍼에 쌓인 메시지를 하나의 메시지로 전송합니다.
+        """
+        if not self._contents and not self._embeds:
+            return
+
+        content = "\n".join(self._contents) or None
+        embeds = self._embeds
+        self._contents = []
+        self._content_length = 0
+        self._embeds = []
+
+        if self.interaction.response.is_done():
+            await self.interaction.followup.send(
+                content=content or discord.utils.MISSING, embeds=embeds, ephemeral=self.ephemeral,
+            )
+        else:
+            await self.interaction.response.send_message(content=content, embeds=embeds, ephemeral=self.ephemeral)
+
+        self.sent = True
+        if self.stats is not None:
+            self.stats.rest_calls += 1
+
+    async def finish(self):
+        """|coro|
+
+        커맨드가 정상적으로 끝났을 때 버퍼를 전송합니다.
+
+        defer한 뒤 보낸 메시지가 없으면 "생각하는 중..." 상태가 남지 않도록 원래 응답을 `DONE_MESSAGE`로 수정합니다.
+        """
+        await self.flush()
+        if not self.sent and self.interaction.response.is_done():
+            await self.interaction.edit_original_response(content=DONE_MESSAGE)
+            if self.stats is not None:
+                self.stats.rest_calls += 1
+
+    async def fail(self, error: BaseException):
+        """|coro|
+
+        커맨드에서 예외가 발생했을 때 버퍼를 버리고 오류 메시지로 응답합니다.
+
+        응답 전이면 명령어 사용자에게만 보이는 메시지로, defer했으면 원래 응답을 수정하여,
+        이미 메시지를 보냈으면 followup 메시지로 오류를 알립니다.
+
+        Args:
+            error (BaseException): 커맨드에서 발생한 예외
+        """
+        self._contents = []
+        self._content_length = 0
+        self._embeds = []
+
+        message = DATABASE_UNAVAILABLE_MESSAGE if isinstance(error, DatabaseUnavailableError) else ERROR_MESSAGE
+        if not self.interaction.response.is_done():
+            await self.interaction.response.send_message(message, ephemeral=True)
+        elif not self.sent:
+            await self.interaction.edit_original_response(content=message)
+        else:
+            await self.interaction.followup.send(message, ephemeral=True)
+
+        self.sent = True
+        if self.stats is not None:
+            self.stats.rest_calls += 1
+
+    def _split_content(self, content: Optional[str]) -> list[str]:
+        """메시지 내용을 최대 길이 이하로 나눕니다."""
+        if not content:
+            return []
+        return [content[i:i + self.MAX_CONTENT_LENGTH] for i in range(0, len(content), self.MAX_CONTENT_LENGTH)]
+
+
+def get_responder(interaction: discord.Interaction) -> InteractionResponder:
+    """`auto_defer`로 감싼 앱 커맨드의 응답 객체를 반환합니다.
+
+    Args:
+        interaction (discord.Interaction): 앱 커맨드 interaction
+
+    Returns:
+        InteractionResponder: 응답 객체
+    """
+    responder = interaction.extras.get(RESPONDER_KEY)
+    if responder is None:
+        raise RuntimeError("This app command is not wrapped with auto_defer().")
+    return responder
+
+
+def auto_defer(latency_budget: float = DEFAULT_LATENCY_BUDGET, *, ephemeral: bool = False):
+    """앱 커맨드가 응답 시간 제한을 넘기지 않도록 감싸는 데코레이터
+
+    커맨드는 즉시 실행되며, `latency_budget`초 안에 끝나지 않으면 interaction을 자동으로 defer합니다.
+    커맨드에서는 `get_responder(interaction).send()`로 응답해야 하며,
+    보낸 메시지는 커맨드가 정상적으로 끝날 때 하나의 REST 호출로 합쳐서 전송됩니다.
+    커맨드에서 예외가 발생하면 보내지 않은 메시지는 버리고 오류 메시지로 응답한 뒤 예외를 다시 발생시킵니다.
+
+    Args:
+        latency_budget (float, optional): defer하기 전까지 기다리는 시간(초). Defaults to DEFAULT_LATENCY_BUDGET.
+        ephemeral (bool, optional): 응답을 명령어 사용자에게만 보여줄지 여부. Defaults to False.
+
+    Examples:
+    ```python
+    class Economy(Cog):
+        @app_commands.command(name="balance")
+        @auto_defer()
+        async def balance(self, interaction: discord.Interaction[Bot]):
+            await get_responder(interaction).send("...")
+    ```
+    """
+    def decorator(func: Callable[..., Coroutine[Any, Any, Any]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = next(arg for arg in args if isinstance(arg, discord.Interaction))
+            stats: Optional[InteractionStats] = getattr(interaction.client, "interaction_stats", None)
+            if stats is not None:
+                stats.invoked += 1
+
+            responder = InteractionResponder(interaction, ephemeral=ephemeral, stats=stats)
+            interaction.extras[RESPONDER_KEY] = responder
+
+            command_name = interaction.command and interaction.command.qualified_name
+            task = asyncio.create_task(func(*args, **kwargs))
+            try:
+                done, _ = await asyncio.wait({task}, timeout=latency_budget)
+                if not done:
+                    logger.debug(f"Deferring interaction of command {command_name}")
+                    try:
+                        await responder.defer()
+                    except (discord.HTTPException, discord.InteractionResponded) as e:
+                        # 응답 시간 제한이 이미 지난 경우 등. 실행 중인 커맨드(DB 쓰기 등)는 끝까지 실행
+                        logger.warning(f"Failed to defer interaction of command {command_name}: {e}")
+                result = await task
+            except asyncio.CancelledError:
+                if not task.done(): # wrapper가 취소된 경우에만 커맨드 취소
+                    task.cancel()
+                raise
+            except Exception as e:
+                try:
+                    await responder.fail(e)
+                except (discord.HTTPException, discord.InteractionResponded) as reply_error:
+                    # 오류 응답에 실패해도 커맨드의 예외를 그대로 전달
+                    logger.warning(f"Failed to send error response of command {command_name}: {reply_error}")
+                raise
+
+            await responder.finish()
+            return result
+
+        return wrapper
+
+    return decorator
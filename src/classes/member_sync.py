@@ -0,0 +1,281 @@
+import discord
+
+import asyncio
+import logging
+from enum import Enum
+from typing import AsyncIterator, Iterable, Optional, TYPE_CHECKING
+
+from sqlalchemy.exc import IntegrityError
+
+from src.database import UserInfo, Priority, DatabaseUnavailableError
+from src.database.circuit_breaker import CONNECTION_ERRORS
+from src.database.repositories import UserRepository
+
+if TYPE_CHECKING:
+    from src.classes.bot import Bot
+
+
+class SyncOp(Enum):
+    """동기화 작업 종류"""
+    JOIN = "join"
+    REMOVE = "remove"
+
+
+class MemberSyncPipeline:
+    """서버 멤버와 DB의 user_info를 동기화하는 파이프라인
+
+    멤버 목록은 `batch_size` 단위로 나뉘어 크기가 제한된 큐를 통해 하나의 worker에게 전달됩니다.
+    큐가 가득 차면 생산자가 대기하므로(backpressure) 큰 서버에서도 메모리에는 몇 개의 batch만 올라가며,
+    worker는 한 번에 하나의 세션만 사용하므로 DB 커넥션 풀을 독점하지 않습니다.
+    DB 장애로 반영하지 못한 batch는 버리지 않고 DB가 복구될 때까지 간격을 늘려 가며 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        bot: "Bot",
+        batch_size: int = 500,
+        max_pending_batches: int = 4,
+        max_prune_ratio: float = 0.2,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 60.0,
+    ):
+        """MemberSyncPipeline 클래스 생성자
+
+        Args:
+            bot (Bot): Discord 봇
+            batch_size (int, optional): 한 번에 DB에 반영할 최대 사용자 수. Defaults to 500.
+            max_pending_batches (int, optional): 큐에 대기할 수 있는 최대 batch 수. Defaults to 4.
+            max_prune_ratio (float, optional): 한 번의 전체 동기화에서 삭제할 수 있는 최대 사용자 비율.
+                이보다 많은 사용자가 서버를 나간 것으로 보이면 삭제하지 않습니다. Defaults to 0.2.
+            retry_delay (float, optional): DB 장애로 실패한 batch를 다시 시도하기 전 처음 대기 시간(초). Defaults to 5.0.
+            max_retry_delay (float, optional): 다시 시도하기 전 최대 대기 시간(초). Defaults to 60.0.
+        """
+        self.bot = bot
+        self.batch_size = batch_size
+        self.max_prune_ratio = max_prune_ratio
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.logger = logging.getLogger(f"discord.classes.{self.__class__.__name__}")
+
+        self._queue: asyncio.Queue[tuple[SyncOp, list[int]]] = asyncio.Queue(maxsize=max_pending_batches)
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._reconcile_lock = asyncio.Lock()
+
+    def start(self):
+        """worker를 시작합니다."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="member-sync-worker")
+
+    async def stop(self):
+        """|coro|
+
+        worker를 종료합니다. 처리되지 않은 batch는 버려집니다.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if not self._queue.empty():
+            self.logger.warning(f"Dropped {self._queue.qsize()} pending member sync batches")
+
+    async def submit_join(self, user_ids: Iterable[int]):
+        """|coro|
+
+        서버에 있는 사용자를 동기화 큐에 추가합니다. 큐가 가득 차면 대기합니다.
+
+        Args:
+            user_ids (Iterable[int]): discord 사용자 ID 목록
+        """
+        await self._submit(SyncOp.JOIN, user_ids)
+
+    async def submit_remove(self, user_ids: Iterable[int]):
+        """|coro|
+
+        서버에서 나간 사용자를 동기화 큐에 추가합니다. 큐가 가득 차면 대기합니다.
+
+        사용자가 삭제되면 연관된 account_info(잔액)와 minecraft_player_info도 함께 삭제됩니다.
+
+        Args:
+            user_ids (Iterable[int]): discord 사용자 ID 목록
+        """
+        await self._submit(SyncOp.REMOVE, user_ids)
+
+    async def reconcile_all(self):
+        """|coro|
+
+        봇이 속한 모든 서버의 멤버를 동기화하고, 어느 서버에도 없는 사용자를 삭제합니다.
+        """
+        async with self._reconcile_lock:
+            for guild in self.bot.guilds:
+                await self._reconcile_guild(guild)
+            await self._prune_departed()
+
+    async def reconcile_guild(self, guild: discord.Guild):
+        """|coro|
+
+        서버의 멤버 중 DB에 없는 사용자를 추가합니다.
+
+        Args:
+            guild (discord.Guild): 동기화할 서버
+        """
+        async with self._reconcile_lock:
+            await self._reconcile_guild(guild)
+
+    def is_member_anywhere(self, user_id: int) -> bool:
+        """사용자가 봇이 속한 서버 중 하나라도 있는지 확인합니다."""
+        return any(guild.get_member(user_id) is not None for guild in self.bot.guilds)
+
+    async def _reconcile_guild(self, guild: discord.Guild):
+        self.logger.info(f"Reconciling members of {guild} (ID: {guild.id})")
+        count = 0
+        async for user_ids in self._member_batches(guild):
+            await self.submit_join(user_ids)
+            count += len(user_ids)
+        self.logger.info(f"Queued {count} members of {guild} (ID: {guild.id})")
+
+    async def _member_batches(self, guild: discord.Guild) -> AsyncIterator[list[int]]:
+        """서버 멤버 ID를 `batch_size` 단위로 반환합니다.
+
+        멤버 캐시가 채워지지 않은 서버는 REST API로 멤버 목록을 페이지 단위로 받아옵니다.
+        """
+        batch: list[int] = []
+        if guild.chunked:
+            members: Iterable[discord.Member] = guild.members
+            for member in members:
+                if not member.bot:
+                    batch.append(member.id)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        else:
+            async for member in guild.fetch_members(limit=None):
+                if not member.bot:
+                    batch.append(member.id)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
+
+    async def _prune_departed(self):
+        """DB의 사용자 중 어느 서버에도 없는 사용자를 삭제합니다.
+
+        삭제된 사용자의 잔액과 마인크래프트 연동 정보도 함께 삭제되므로, 멤버 캐시가 비어 있거나
+        `max_prune_ratio`보다 많은 사용자가 나간 것으로 보이는 경우에는 삭제하지 않습니다.
+        """
+        if not self.bot.guilds:
+            self.logger.warning("Skipping departed member pruning: bot is not in any guild")
+            return
+        if not all(guild.chunked for guild in self.bot.guilds):
+            self.logger.warning("Skipping departed member pruning: member cache is not fully chunked")
+            return
+
+        # 삭제하기 전에 나간 사용자의 비율을 먼저 확인
+        total = 0
+        departed_count = 0
+        async for batch_size, departed in self._departed_batches():
+            total += batch_size
+            departed_count += len(departed)
+        if departed_count > total * self.max_prune_ratio:
+            self.logger.error(
+                f"Skipping departed member pruning: {departed_count}/{total} users appear to have left, "
+                f"which exceeds the limit of {self.max_prune_ratio:.0%}"
+            )
+            return
+
+        removed = 0
+        async for _, departed in self._departed_batches():
+            if departed:
+                await self.submit_remove(departed)
+                removed += len(departed)
+
+        self.logger.info(f"Queued {removed} departed users for removal")
+
+    async def _departed_batches(self) -> AsyncIterator[tuple[int, list[int]]]:
+        """DB의 사용자를 `batch_size` 단위로 순회하며 (batch 크기, 어느 서버에도 없는 사용자 ID 목록)을 반환합니다."""
+        after_id = 0
+        while True:
+            async with self.bot.database.session_scope(read_only=True, priority=Priority.BACKGROUND) as session:
+                user_ids = await UserRepository(session).get_ids_after(after_id, self.batch_size)
+            if not user_ids:
+                break
+
+            yield len(user_ids), [user_id for user_id in user_ids if not self.is_member_anywhere(user_id)]
+            after_id = user_ids[-1]
+
+    async def _submit(self, op: SyncOp, user_ids: Iterable[int]):
+        user_ids = list(user_ids)
+        for i in range(0, len(user_ids), self.batch_size):
+            await self._queue.put((op, user_ids[i:i + self.batch_size]))
+
+    async def _run(self):
+        """큐에서 batch를 꺼내 DB에 반영합니다.
+
+        같은 종류의 작업이 연달아 대기 중이면 `batch_size`까지 합쳐서 처리합니다.
+        DB 장애로 실패한 batch는 순서가 바뀌지 않도록 다음 batch보다 먼저 다시 시도합니다.
+        """
+        pending: Optional[tuple[SyncOp, list[int]]] = None
+        retry: Optional[tuple[SyncOp, list[int]]] = None
+        delay = self.retry_delay
+        while True:
+            if retry is not None:
+                op, user_ids = retry
+            else:
+                op, user_ids = pending or await self._queue.get()
+                pending = None
+
+                while len(user_ids) < self.batch_size and not self._queue.empty():
+                    next_op, next_ids = self._queue.get_nowait()
+                    if next_op is not op or len(user_ids) + len(next_ids) > self.batch_size:
+                        pending = (next_op, next_ids)
+                        break
+                    user_ids = user_ids + next_ids
+
+            try:
+                await self._apply(op, user_ids)
+            except (DatabaseUnavailableError, *CONNECTION_ERRORS) as e:
+                self.logger.warning(
+                    f"Database unavailable, retrying member sync batch ({op.value}, {len(user_ids)} users) "
+                    f"in {delay:.0f}s: {e}"
+                )
+                retry = (op, user_ids)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+            except Exception:
+                self.logger.error(f"Failed to apply member sync batch ({op.value}, {len(user_ids)} users)", exc_info=True)
+
+            retry = None
+            delay = self.retry_delay
+
+    async def _apply(self, op: SyncOp, user_ids: list[int]):
+        if op is SyncOp.JOIN:
+            try:
+                await self._add_new(user_ids)
+            except IntegrityError:
+                # 확인한 뒤 다른 곳(사용자 등록 명령어 등)에서 먼저 추가한 사용자가 있으면 한 명씩 추가
+                self.logger.debug(f"Conflict while adding {len(user_ids)} users, retrying one by one")
+                for user_id in user_ids:
+                    try:
+                        await self._add_new([user_id])
+                    except IntegrityError:
+                        pass
+        else:
+            async with self.bot.database.session_scope(priority=Priority.BACKGROUND) as session:
+                await UserRepository(session).delete_many(user_ids)
+            self.logger.debug(f"Removed up to {len(user_ids)} users")
+
+    async def _add_new(self, user_ids: list[int]):
+        """DB에 없는 사용자만 추가합니다."""
+        async with self.bot.database.session_scope(priority=Priority.BACKGROUND) as session:
+            repository = UserRepository(session)
+            existing = {user.discord_user_id for user in await repository.get_many(user_ids)}
+            new_ids = set(user_ids) - existing
+            repository.add_many(UserInfo(discord_user_id=user_id) for user_id in new_ids)
+        if new_ids:
+            self.logger.debug(f"Added {len(new_ids)} users")
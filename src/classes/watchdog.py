@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger("discord.classes.watchdog")
+
+
+@dataclass
+class StallReport:
+    """이벤트 루프 정지 기록
+
+    Attributes:
+        started_at (float): 정지가 시작된 시각 (`time.time()`)
+        duration (float): 정지된 시간(초). 루프가 복구되기 전에는 감지 시점까지의 시간
+        command (Optional[str]): 정지 당시 실행 중이던 명령어
+        stack (str): 정지 당시 이벤트 루프 스레드의 스택
+    """
+    started_at: float
+    duration: float
+    command: Optional[str]
+    stack: str
+
+
+class LoopLagWatchdog:
+    """이벤트 루프 지연을 감시하는 클래스
+
+    이벤트 루프에서 `interval`마다 heartbeat를 기록하고, 별도 스레드에서 heartbeat가 `threshold` 이상 늦어지면
+    이벤트 루프 스레드의 스택을 캡처합니다. 루프가 막혀 있는 동안에도 캡처할 수 있으므로
+    어떤 코드가 루프를 막았는지 확인할 수 있습니다.
+    """
+
+    def __init__(self, interval: float = 0.25, threshold: float = 0.5):
+        """LoopLagWatchdog 클래스 생성자
+
+        Args:
+            interval (float, optional): heartbeat 주기(초). Defaults to 0.25.
+            threshold (float, optional): 정지로 판단하는 지연 시간(초). Defaults to 0.5.
+        """
+        self.interval = interval
+        self.threshold = threshold
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stall_count = 0
+        self.last_stall: Optional[StallReport] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._captured_stall: Optional[StallReport] = None
+        self._heartbeat_task: Optional[asyncio.Task[None]] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # 실행 중인 task -> 명령어 설명
+        self._commands: weakref.WeakKeyDictionary[asyncio.Task, str] = weakref.WeakKeyDictionary()
+        self._commands_lock = threading.Lock()
+
+    def start(self):
+        """감시를 시작합니다. 이벤트 루프 안에서 호출해야 합니다."""
+        if self._heartbeat_task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+
+        self._heartbeat_task = self._loop.create_task(self._heartbeat(), name="loop-lag-heartbeat")
+        self._monitor_thread = threading.Thread(target=self._monitor, name="loop-lag-watchdog", daemon=True)
+        self._monitor_thread.start()
+
+    async def stop(self):
+        """|coro|
+
+        감시를 종료합니다.
+        """
+        self._stop_event.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._monitor_thread is not None:
+            await asyncio.to_thread(self._monitor_thread.join)
+            self._monitor_thread = None
+
+    def track(self, command: str):
+        """현재 task에서 실행 중인 명령어를 기록합니다.
+
+        정지가 감지되면 기록된 명령어를 원인으로 보고합니다.
+
+        Args:
+            command (str): 명령어 설명
+        """
+        task = asyncio.current_task()
+        if task is None:
+            return
+        with self._commands_lock:
+            self._commands[task] = command
+
+    async def _heartbeat(self):
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+            lag = max(0.0, time.monotonic() - self._last_beat - self.interval)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+
+            if lag >= self.threshold:
+                # 감시 스레드가 캡처하지 못한 짧은 정지는 스택 없이 기록
+                report = self._captured_stall or StallReport(
+                    started_at=time.time() - lag,
+                    duration=lag,
+                    command=None,
+                    stack="<not captured>",
+                )
+                self._captured_stall = None
+                report.duration = max(report.duration, lag)
+
+                self.stall_count += 1
+                self.last_stall = report
+                logger.warning(f"Event loop was blocked for {lag:.3f}s | Command: {report.command}")
+
+    def _monitor(self):
+        """별도 스레드에서 heartbeat 지연을 확인합니다."""
+        captured = False
+        while not self._stop_event.wait(self.interval):
+            stalled_for = time.monotonic() - self._last_beat - self.interval
+            if stalled_for < self.threshold:
+                captured = False
+                continue
+            if captured: # 같은 정지에 대해 한 번만 캡처
+                continue
+
+            captured = True
+            report = self._capture(stalled_for)
+            self._captured_stall = report
+            logger.warning(
+                f"Event loop blocked for {stalled_for:.3f}s | "
+                f"Command: {report.command}\n"
+                f"{report.stack}"
+            )
+
+    def _capture(self, stalled_for: float) -> StallReport:
+        """이벤트 루프 스레드의 스택과 실행 중인 명령어를 캡처합니다."""
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id else None
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>"
+
+        command = None
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        if task is not None:
+            with self._commands_lock:
+                command = self._commands.get(task)
+
+        return StallReport(
+            started_at=time.time() - stalled_for,
+            duration=stalled_for,
+            command=command,
+            stack=stack,
+        )
@@ -16,7 +16,29 @@ class AdminCommands(Cog):
     )
     @commands.is_owner()
     async def ping(self, ctx: commands.Context[Bot]):
-        await ctx.reply(f"pong! latency: {round(self.bot.latency * 1000)}ms")
+        stats = self.bot.interaction_stats
+        watchdog = self.bot.watchdog
+        message = (
+            f"pong! latency: {round(self.bot.latency * 1000)}ms\n"
+            f"app command deferred: {stats.deferred}/{stats.invoked} ({stats.deferral_rate:.1%}) | "
+            f"messages: {stats.messages}, REST calls: {stats.rest_calls}\n"
+            f"loop lag: {round(watchdog.last_lag * 1000)}ms (max {round(watchdog.max_lag * 1000)}ms) | "
+            f"stalls: {watchdog.stall_count}"
+        )
+        engine = self.bot.database.engine
+        scheduler = self.bot.database.schedulers.get(engine) if engine is not None else None
+        if scheduler is not None:
+            message += "\ndb queue wait: " + " | ".join(
+                f"{priority.value} p99 {round(wait.percentile(99) * 1000)}ms (max {round(wait.max_wait * 1000)}ms, n={wait.count})"
+                for priority, wait in scheduler.stats.items()
+            )
+        if watchdog.last_stall is not None:
+            stall = watchdog.last_stall
+            message += (
+                f"\nlast stall: {round(stall.duration * 1000)}ms at <t:{int(stall.started_at)}:T> | "
+                f"command: {stall.command}"
+            )
+        await ctx.reply(message)
 
 
 async def setup(bot: Bot):
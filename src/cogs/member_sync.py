@@ -0,0 +1,46 @@
+import discord
+from discord.ext import commands
+
+from src.classes.bot import Bot, Cog
+from src.classes.member_sync import MemberSyncPipeline
+
+
+class MemberSync(Cog):
+    """서버 멤버와 DB 사용자 정보 동기화"""
+
+    hidden_help_command = True # 도움말에 표시하지 않음
+
+    def __init__(self, bot: Bot):
+        super().__init__(bot)
+        self.pipeline = MemberSyncPipeline(bot)
+
+    async def cog_load(self):
+        self.pipeline.start()
+
+    async def cog_unload(self):
+        await self.pipeline.stop()
+
+    # 봇 시작 또는 재연결 후 전체 동기화
+    @commands.Cog.listener()
+    async def on_ready(self):
+        await self.pipeline.reconcile_all()
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        await self.pipeline.reconcile_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if member.bot:
+            return
+        await self.pipeline.submit_join([member.id])
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if member.bot or self.pipeline.is_member_anywhere(member.id):
+            return
+        await self.pipeline.submit_remove([member.id])
+
+
+async def setup(bot: Bot):
+    await bot.add_cog(MemberSync(bot))
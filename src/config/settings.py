@@ -16,11 +16,13 @@ class Environment:
     DISCORD_BOT_PREFIX: str
     DISCORD_BOT_ACTIVITY: Optional[str]
     DISCORD_GUILD_ID: Optional[int]
+    DISCORD_BOT_RUNTIME_MODE: Optional[str]
     MYSQL_HOST: str
     MYSQL_USER: str
     MYSQL_PORT: int
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str
+    MYSQL_REPLICA_URLS: Optional[str]
     LOG_LEVEL: str
 
     @classmethod
@@ -1,5 +1,7 @@
 from .session import DiscraftDBConnection
-from .models import UserInfo, AccountInfo, MinecraftPlayerInfo
+from .models import UserInfo, AccountInfo, MinecraftPlayerInfo, AppliedJournalEntry
+from .circuit_breaker import DatabaseUnavailableError
+from .scheduler import Priority
 
 
 __all__ = [
@@ -7,4 +9,7 @@ __all__ = [
     "UserInfo",
     "AccountInfo",
     "MinecraftPlayerInfo",
+    "AppliedJournalEntry",
+    "DatabaseUnavailableError",
+    "Priority",
 ]
@@ -0,0 +1,155 @@
+import logging
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy.exc import (
+    InterfaceError,
+    OperationalError,
+    TimeoutError as PoolTimeoutError,
+)
+
+logger = logging.getLogger("discord.database.circuit_breaker")
+
+# DB 장애로 간주하는 예외
+CONNECTION_ERRORS = (
+    OperationalError,
+    InterfaceError,
+    PoolTimeoutError,
+    OSError,
+    TimeoutError,
+)
+
+
+class DatabaseUnavailableError(Exception):
+    """DB 장애로 circuit breaker가 열려 있을 때 발생하는 예외"""
+    pass
+
+
+class CircuitState(Enum):
+    """circuit breaker 상태"""
+    CLOSED = "closed"       # 정상
+    OPEN = "open"           # 장애. 요청을 즉시 실패시킴
+    HALF_OPEN = "half_open" # 복구 확인 중
+
+
+class CircuitBreaker:
+    """DB 장애 시 요청을 즉시 실패시키는 circuit breaker
+
+    `window`초 안에 DB 오류 또는 `slow_call_threshold`초 이상 걸린 쿼리가 `failure_threshold`번 발생하면 열립니다.
+    열린 뒤 `reset_timeout`초가 지나면 요청을 다시 허용하며(half-open), 성공하면 닫히고 실패하면 다시 열립니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        slow_call_threshold: float = 2.0,
+        window: float = 30.0,
+        reset_timeout: float = 15.0,
+    ):
+        """CircuitBreaker 클래스 생성자
+
+        Args:
+            failure_threshold (int, optional): circuit을 여는 실패 횟수. Defaults to 5.
+            slow_call_threshold (float, optional): 실패로 간주하는 쿼리 실행 시간(초). Defaults to 2.0.
+            window (float, optional): 실패 횟수를 세는 기간(초). Defaults to 30.0.
+            reset_timeout (float, optional): 열린 뒤 다시 요청을 허용하기까지의 시간(초). Defaults to 15.0.
+        """
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+
+        self.state = CircuitState.CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._close_listeners: list[Callable[[], Any]] = []
+
+    def add_close_listener(self, listener: Callable[[], Any]):
+        """circuit이 다시 닫힐 때(DB 복구) 호출할 함수를 등록합니다."""
+        self._close_listeners.append(listener)
+
+    def before_call(self):
+        """요청 전에 호출합니다.
+
+        Raises:
+            DatabaseUnavailableError: circuit이 열려 있는 경우
+        """
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                raise DatabaseUnavailableError("Database circuit breaker is open")
+            self.state = CircuitState.HALF_OPEN
+            logger.info("Database circuit breaker half-open, probing database")
+
+    def record_success(self):
+        """요청이 성공했음을 기록합니다."""
+        if self.state is CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self._failures.clear()
+            logger.info("Database circuit breaker closed")
+            for listener in self._close_listeners:
+                listener()
+
+    def record_failure(self):
+        """요청이 실패했음을 기록합니다."""
+        now = time.monotonic()
+        if self.state is CircuitState.HALF_OPEN:
+            self._open(now)
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+
+        if self.state is CircuitState.CLOSED and len(self._failures) >= self.failure_threshold:
+            self._open(now)
+
+    def record_latency(self, elapsed: float):
+        """쿼리 실행 시간을 기록합니다. `slow_call_threshold` 이상이면 실패로 기록합니다."""
+        if elapsed >= self.slow_call_threshold:
+            logger.warning(f"Slow database query: {elapsed:.3f}s")
+            self.record_failure()
+
+    def _open(self, now: float):
+        self.state = CircuitState.OPEN
+        self._opened_at = now
+        logger.error(f"Database circuit breaker opened for {self.reset_timeout}s")
+
+
+class StaleReadCache:
+    """DB 장애 시 마지막으로 읽은 값을 제공하기 위한 LRU 캐시"""
+
+    def __init__(self, max_size: int = 4096, max_age: float = 600.0):
+        """StaleReadCache 클래스 생성자
+
+        Args:
+            max_size (int, optional): 최대 항목 수. Defaults to 4096.
+            max_age (float, optional): 값을 제공할 수 있는 최대 시간(초). Defaults to 600.0.
+        """
+        self.max_size = max_size
+        self.max_age = max_age
+        self._items: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 오래된 경우 None을 반환합니다."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        stored_at, value = item
+        if time.monotonic() - stored_at > self.max_age:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """값을 캐시에 저장합니다."""
+        self._items[key] = (time.monotonic(), value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """캐시된 값을 삭제합니다."""
+        self._items.pop(key, None)
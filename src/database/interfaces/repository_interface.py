@@ -4,7 +4,11 @@ from typing import Optional, Sequence
 
 
 class IRepository[T](ABC):
-    """DB Repository Interface"""
+    """DB Repository Interface
+
+    구현 클래스는 자주 실행되는 쿼리를 모듈 수준에서 한 번만 생성하고 bound parameter로 값을 전달하여
+    SQLAlchemy의 cache key 계산과 컴파일 결과를 재사용합니다.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
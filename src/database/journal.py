@@ -0,0 +1,383 @@
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .circuit_breaker import CONNECTION_ERRORS, DatabaseUnavailableError
+from .models import AppliedJournalEntry
+from .repositories import AccountRepository
+from .scheduler import Priority
+from .session import DiscraftDBConnection
+
+logger = logging.getLogger("discord.database.journal")
+
+
+class JournalOp(str, Enum):
+    """journal 항목 종류"""
+    BALANCE_DELTA = "balance_delta"
+    CHECK_IN = "check_in"
+
+
+class WriteResult(str, Enum):
+    """경제 관련 쓰기 결과"""
+    APPLIED = "applied"     # DB에 반영됨
+    NOOP = "noop"           # 변경할 내용이 없음 (계정이 없거나, 이미 출석체크했거나, 이미 반영된 항목)
+    JOURNALED = "journaled" # journal에 기록되어 나중에 반영됨
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """DB에 반영할 경제 관련 쓰기
+
+    Attributes:
+        op (JournalOp): 쓰기 종류
+        discord_user_id (int): discord 사용자 ID
+        amount (int): 증감할 금액 (출석체크의 경우 보상 금액)
+        timestamp (int): 쓰기가 요청된 시간
+        entry_id (str): 중복 반영을 막기 위한 고유 ID
+    """
+    op: JournalOp
+    discord_user_id: int
+    amount: int = 0
+    timestamp: int = field(default_factory=lambda: int(time.time()))
+    entry_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    def to_json(self) -> str:
+        return json.dumps({**asdict(self), "op": self.op.value}, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "JournalEntry":
+        data = json.loads(line)
+        return cls(**{**data, "op": JournalOp(data["op"])})
+
+
+class WriteJournal:
+    """append-only 로컬 쓰기 journal 파일
+
+    한 줄에 하나의 JournalEntry를 JSON으로 기록하며, 기록할 때마다 fsync하여 프로세스가 종료되어도 유지됩니다.
+    """
+
+    def __init__(self, path: str | Path):
+        """WriteJournal 클래스 생성자
+
+        Args:
+            path (str | Path): journal 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = asyncio.Lock()
+
+    async def append(self, entry: JournalEntry):
+        """|coro|
+
+        journal 끝에 항목을 추가합니다.
+
+        Args:
+            entry (JournalEntry): 추가할 항목
+        """
+        async with self._lock:
+            await asyncio.to_thread(self._append, entry.to_json())
+
+    def has_entries(self) -> bool:
+        """journal에 기록된 내용이 있는지 확인합니다."""
+        try:
+            return self.path.stat().st_size > 0
+        except FileNotFoundError:
+            return False
+
+    def read(self) -> list[JournalEntry]:
+        """journal의 모든 항목을 기록된 순서대로 반환합니다.
+
+        프로세스 종료로 마지막 줄이 잘린 경우 해당 줄은 무시합니다.
+        """
+        if not self.path.exists():
+            return []
+
+        entries = []
+        with self.path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(JournalEntry.from_json(line))
+                except (ValueError, TypeError, KeyError):
+                    logger.warning(f"Ignoring malformed journal entry at {self.path}:{line_no}")
+        return entries
+
+    async def discard(self, entries: list[JournalEntry]):
+        """|coro|
+
+        반영이 끝난 항목과 읽을 수 없는 항목을 journal에서 삭제합니다. 그 사이에 추가된 항목은 유지됩니다.
+
+        Args:
+            entries (list[JournalEntry]): 삭제할 항목
+        """
+        if not entries:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._discard, {entry.entry_id for entry in entries})
+
+    def _append(self, line: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as f:
+            # 이전 기록이 중간에 잘린 경우 다음 줄에 기록
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write((line + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _discard(self, entry_ids: set[str]):
+        remaining = []
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    if JournalEntry.from_json(line).entry_id in entry_ids:
+                        continue
+                except (ValueError, TypeError, KeyError):
+                    continue
+                remaining.append(line)
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.writelines(remaining)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+async def apply_entry(session: AsyncSession, entry: JournalEntry, *, check_applied: bool = True) -> WriteResult:
+    """|coro|
+
+    journal 항목을 DB에 반영하고 반영 기록을 남깁니다.
+
+    Args:
+        session (AsyncSession): 비동기 세션
+        entry (JournalEntry): 반영할 항목
+        check_applied (bool, optional): 이미 반영된 항목인지 확인할지 여부. Defaults to True.
+
+    Returns:
+        WriteResult: 잔액 또는 출석체크가 변경되었으면 `APPLIED`, 이미 반영된 항목이거나 변경할 내용이 없으면 `NOOP`
+    """
+    if check_applied and await session.get(AppliedJournalEntry, entry.entry_id) is not None:
+        return WriteResult.NOOP
+
+    repository = AccountRepository(session)
+    if entry.op is JournalOp.BALANCE_DELTA:
+        updated = await repository.add_balance(entry.discord_user_id, entry.amount)
+    else:
+        updated = await repository.check_in(entry.discord_user_id, entry.timestamp, entry.amount)
+
+    if not updated and entry.op is JournalOp.CHECK_IN:
+        logger.info(f"Account of {entry.discord_user_id} not found or already checked in, skipping check-in ({entry.entry_id})")
+    elif not updated:
+        logger.warning(f"Account of {entry.discord_user_id} not found, skipping {entry.op.value} ({entry.entry_id})")
+
+    session.add(AppliedJournalEntry(entry_id=entry.entry_id, applied_at=int(time.time())))
+    return WriteResult.APPLIED if updated else WriteResult.NOOP
+
+
+class EconomyWriter:
+    """잔액 증감, 출석체크 등 경제 관련 쓰기를 처리하는 클래스
+
+    DB 장애로 바로 반영할 수 없는 쓰기는 journal에 기록해 두었다가 DB가 복구되면 기록된 순서대로 다시 반영합니다.
+    journal에 반영하지 못한 항목이 있거나 반영 중인 동안의 쓰기도 journal 끝에 기록되므로,
+    요청된 순서와 다르게 반영되어 먼저 요청된 쓰기가 무시되는 일이 없습니다.
+    각 항목의 반영 기록은 같은 트랜잭션에 저장되므로 같은 항목이 두 번 반영되지 않습니다.
+    잔액은 증감으로 반영되고 출석체크 보상은 주기마다 한 번만 지급되므로, DB 장애 중 같은 사용자의 출석체크가
+    여러 번 journal에 기록되어도 보상은 한 번만 지급됩니다.
+
+    반영 기록은 `applied_journal_entry` 테이블에 저장되므로 DB에 해당 테이블이 있어야 합니다. (README.md 참고)
+    """
+
+    # 반영 기록을 보관하는 기간(초)
+    APPLIED_RETENTION = 7 * 24 * 60 * 60
+    # 보관 기간이 지난 반영 기록을 삭제하는 주기(초)
+    PRUNE_INTERVAL = 60 * 60
+    # DB 장애가 아닌 이유로 반영에 실패한 항목을 dead-letter journal로 옮기기 전까지 시도하는 횟수
+    MAX_REPLAY_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        database: DiscraftDBConnection,
+        journal: WriteJournal,
+        dead_letter: Optional[WriteJournal] = None,
+    ):
+        """EconomyWriter 클래스 생성자
+
+        Args:
+            database (DiscraftDBConnection): DB 연결
+            journal (WriteJournal): 쓰기 journal
+            dead_letter (Optional[WriteJournal], optional): 반영할 수 없는 항목을 옮겨둘 journal.
+                Defaults to `journal`과 같은 위치의 `*.dead.jsonl` 파일.
+        """
+        self.database = database
+        self.journal = journal
+        self.dead_letter = dead_letter or WriteJournal(journal.path.with_suffix(".dead" + journal.path.suffix))
+        self._replay_task: Optional[asyncio.Task[int]] = None
+        self._prune_task: Optional[asyncio.Task[None]] = None
+        self._replay_failures: dict[str, int] = {}
+        # 같은 항목을 동시에 반영하지 않도록 반영 작업을 하나씩 실행
+        self._replay_lock = asyncio.Lock()
+        # 이전 실행에서 반영하지 못한 항목이 있으면 다음 쓰기가 성공할 때 다시 반영
+        self._has_pending = self.journal.has_entries()
+
+        self.database.breaker.add_close_listener(self.schedule_replay)
+
+    async def add_balance(self, discord_user_id: int, amount: int) -> WriteResult:
+        """|coro|
+
+        잔액을 증감합니다.
+
+        Args:
+            discord_user_id (int): discord 사용자 ID
+            amount (int): 증감할 금액
+
+        Returns:
+            WriteResult: 반영 결과. 계정이 없으면 `NOOP`
+        """
+        return await self._write(JournalEntry(JournalOp.BALANCE_DELTA, discord_user_id, amount))
+
+    async def check_in(self, discord_user_id: int, reward: int = 0, timestamp: Optional[int] = None) -> WriteResult:
+        """|coro|
+
+        출석체크를 기록합니다. 이미 같은 주기에 출석체크한 경우 보상은 지급되지 않습니다.
+
+        Args:
+            discord_user_id (int): discord 사용자 ID
+            reward (int, optional): 출석체크 보상 금액. Defaults to 0.
+            timestamp (Optional[int], optional): 출석체크 시간. Defaults to 현재 시간.
+
+        Returns:
+            WriteResult: 반영 결과. 계정이 없거나 이미 같은 주기에 출석체크한 경우 `NOOP`
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        return await self._write(JournalEntry(JournalOp.CHECK_IN, discord_user_id, reward, timestamp))
+
+    def start(self):
+        """이전 실행에서 반영하지 못한 쓰기를 반영하고, 반영 기록을 주기적으로 삭제하는 작업을 시작합니다."""
+        self.schedule_replay()
+        if self._prune_task is None or self._prune_task.done():
+            self._prune_task = asyncio.get_running_loop().create_task(self._prune_periodically())
+
+    def schedule_replay(self):
+        """journal 반영 작업을 백그라운드에서 시작합니다."""
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.get_running_loop().create_task(self.replay())
+
+    async def replay(self) -> int:
+        """|coro|
+
+        journal의 항목을 기록된 순서대로 DB에 반영합니다.
+
+        반영하는 동안 journal에 새로 기록된 항목도 이어서 반영합니다. 이미 반영 중이면 끝날 때까지 기다린 뒤 실행됩니다.
+        DB 장애로 중단되면 반영하지 못한 항목은 journal에 남습니다.
+        DB 장애가 아닌 이유로 `MAX_REPLAY_ATTEMPTS`번 반영에 실패한 항목은 나머지 항목을 막지 않도록
+        dead-letter journal로 옮겨지며, 원인을 해결한 뒤 직접 다시 반영해야 합니다.
+
+        Returns:
+            int: journal에서 처리된 항목 수 (dead-letter journal로 옮겨진 항목 포함)
+        """
+        async with self._replay_lock:
+            total = 0
+            seen: set[str] = set()
+            while True:
+                entries = [entry for entry in await asyncio.to_thread(self.journal.read) if entry.entry_id not in seen]
+                if not entries:
+                    break
+                seen.update(entry.entry_id for entry in entries)
+                count, interrupted = await self._replay_entries(entries)
+                total += count
+                if interrupted:
+                    break
+
+            # 반영하지 못한 항목은 다음에 반영
+            self._has_pending = self.journal.has_entries()
+            return total
+
+    async def _replay_entries(self, entries: list[JournalEntry]) -> tuple[int, bool]:
+        """journal 항목을 순서대로 반영하고 (처리된 항목 수, DB 장애로 중단되었는지 여부)를 반환합니다."""
+        processed: list[JournalEntry] = []
+        interrupted = False
+        try:
+            for entry in entries:
+                try:
+                    async with self.database.session_scope(user_id=entry.discord_user_id, priority=Priority.BACKGROUND) as session:
+                        await apply_entry(session, entry)
+                except (DatabaseUnavailableError, *CONNECTION_ERRORS):
+                    raise
+                except Exception as e:
+                    attempts = self._replay_failures.get(entry.entry_id, 0) + 1
+                    if attempts < self.MAX_REPLAY_ATTEMPTS:
+                        # 다음 반영 때 다시 시도
+                        self._replay_failures[entry.entry_id] = attempts
+                        logger.warning(f"Failed to replay journal entry {entry} (attempt {attempts}): {e}")
+                        continue
+                    logger.error(f"Moving journal entry {entry} to {self.dead_letter.path}", exc_info=True)
+                    await self.dead_letter.append(entry)
+                    self._replay_failures.pop(entry.entry_id, None)
+                processed.append(entry)
+        except (DatabaseUnavailableError, *CONNECTION_ERRORS) as e:
+            interrupted = True
+            logger.warning(f"Journal replay interrupted after {len(processed)}/{len(entries)} entries: {e}")
+        finally:
+            await self.journal.discard(processed)
+
+        logger.info(f"Replayed {len(processed)}/{len(entries)} journal entries")
+        return len(processed), interrupted
+
+    async def close(self):
+        """|coro|
+
+        진행 중인 journal 반영 작업과 반영 기록 삭제 작업을 취소합니다.
+        """
+        for task in (self._replay_task, self._prune_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def _write(self, entry: JournalEntry) -> WriteResult:
+        # 먼저 기록된 항목보다 먼저 반영되지 않도록 journal 뒤에 기록하고 반영 작업에서 순서대로 반영
+        if self._has_pending or self._replay_lock.locked():
+            await self.journal.append(entry)
+            # circuit breaker가 열리지 않은 짧은 장애 동안 기록된 항목도 함께 반영
+            self.schedule_replay()
+            return WriteResult.JOURNALED
+
+        try:
+            async with self.database.session_scope(user_id=entry.discord_user_id) as session:
+                return await apply_entry(session, entry, check_applied=False)
+        except (DatabaseUnavailableError, *CONNECTION_ERRORS) as e:
+            logger.warning(f"Database unavailable, journaling {entry.op.value} of {entry.discord_user_id}: {e}")
+            await self.journal.append(entry)
+            self._has_pending = True
+            return WriteResult.JOURNALED
+
+    async def _prune_periodically(self):
+        while True:
+            try:
+                await self._prune_applied()
+            except Exception:
+                logger.error("Failed to prune applied journal entries", exc_info=True)
+            await asyncio.sleep(self.PRUNE_INTERVAL)
+
+    async def _prune_applied(self):
+        """보관 기간이 지난 반영 기록을 삭제합니다."""
+        try:
+            async with self.database.session_scope(priority=Priority.BACKGROUND) as session:
+                await session.execute(
+                    delete(AppliedJournalEntry)
+                    .filter(AppliedJournalEntry.applied_at < int(time.time()) - self.APPLIED_RETENTION)
+                )
+        except (DatabaseUnavailableError, *CONNECTION_ERRORS) as e:
+            logger.warning(f"Failed to prune applied journal entries: {e}")
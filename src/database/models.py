@@ -39,6 +39,10 @@ class AccountInfo(Base):
     """
     DB의 account_info 테이블과 매핑되는 클래스
 
+    Constants:
+        CHECK_IN_PERIOD (int): 출석체크 주기(초). 주기마다 한 번만 보상을 받을 수 있습니다.
+        CHECK_IN_UTC_OFFSET (int): 출석체크 주기가 시작되는 시간대의 UTC offset(초)
+
     Attributes:
         account_id (int): 기본 키로 사용되는 계정 ID
         discord_user_id (int): 외래 키로 사용되는 Discord 사용자 ID
@@ -49,6 +53,9 @@ class AccountInfo(Base):
         user_info (UserInfo): 사용자 정보를 나타내는 UserInfo 모델과의 관계
     """
 
+    CHECK_IN_PERIOD: Final[int] = 24 * 60 * 60
+    CHECK_IN_UTC_OFFSET: Final[int] = 9 * 60 * 60 # KST 자정 기준
+
     __tablename__ = "account_info"
 
     account_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -99,3 +106,24 @@ class MinecraftPlayerInfo(Base):
     def __repr__(self):
         attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items() if not k.startswith("_"))
         return f"{self.__class__.__name__}({attrs})"
+
+
+class AppliedJournalEntry(Base):
+    """
+    DB의 applied_journal_entry 테이블과 매핑되는 클래스
+
+    로컬 쓰기 journal의 항목이 이미 DB에 반영되었는지 확인하는 데 사용합니다.
+
+    Attributes:
+        entry_id (str): 기본 키로 사용되는 journal 항목 ID
+        applied_at (int): 항목이 반영된 시간
+    """
+
+    __tablename__ = "applied_journal_entry"
+
+    entry_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    applied_at: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, index=True, comment="항목이 반영된 시간")
+
+    def __repr__(self):
+        attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items() if not k.startswith("_"))
+        return f"{self.__class__.__name__}({attrs})"
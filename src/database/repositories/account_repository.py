@@ -1,10 +1,32 @@
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, bindparam
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence, cast
 
 from ..interfaces import IRepository
 from ..models import AccountInfo
 
+_SELECT_BY_ID = select(AccountInfo).filter(AccountInfo.discord_user_id == bindparam("entity_id"))
+_SELECT_PAGE = select(AccountInfo).offset(bindparam("skip")).limit(bindparam("limit"))
+_SELECT_FROM = select(AccountInfo).offset(bindparam("skip"))
+_ADD_BALANCE = (
+    update(AccountInfo)
+    .filter(AccountInfo.discord_user_id == bindparam("entity_id"))
+    .values(balance=AccountInfo.balance + bindparam("amount"))
+)
+# 마지막 출석체크가 이번 주기보다 이전인 경우에만 반영되므로 같은 출석체크가 여러 번 반영되어도 보상은 한 번만 지급됩니다.
+_CHECK_IN = (
+    update(AccountInfo)
+    .filter(
+        AccountInfo.discord_user_id == bindparam("entity_id"),
+        or_(AccountInfo.last_check_in == 0, AccountInfo.last_check_in < bindparam("period_start")), # 0: 출석체크 기록 없음
+    )
+    .values(
+        balance=AccountInfo.balance + bindparam("reward"),
+        last_check_in=bindparam("timestamp"),
+    )
+)
+
 
 class AccountRepository(IRepository[AccountInfo]):
     """AccountInfo 데이터베이스 Repository 클래스
@@ -27,9 +49,7 @@ class AccountRepository(IRepository[AccountInfo]):
         Returns:
             Optional[AccountInfo]: 데이터
         """
-        result = await self.session.execute(
-            select(AccountInfo).filter(AccountInfo.discord_user_id == entity_id)
-        )
+        result = await self.session.execute(_SELECT_BY_ID, {"entity_id": entity_id})
         return result.scalars().first()
 
     async def get_all(self, skip: int = 0, limit: Optional[int] = 100) -> Sequence[AccountInfo]:
@@ -44,9 +64,10 @@ class AccountRepository(IRepository[AccountInfo]):
         Returns:
             Sequence[AccountInfo]: 모든 데이터
         """
-        result = await self.session.execute(
-            select(AccountInfo).offset(skip).limit(limit)
-        )
+        if limit is None:
+            result = await self.session.execute(_SELECT_FROM, {"skip": skip})
+        else:
+            result = await self.session.execute(_SELECT_PAGE, {"skip": skip, "limit": limit})
         return result.scalars().all()
 
     def add(self, entity: AccountInfo):
@@ -76,3 +97,50 @@ class AccountRepository(IRepository[AccountInfo]):
             entity (AccountInfo): 삭제할 데이터
         """
         await self.session.delete(entity)
+
+    async def add_balance(self, entity_id: int, amount: int) -> bool:
+        """|coro|
+
+        잔액을 `amount`만큼 증감합니다.
+
+        세션에 로드된 AccountInfo 객체에는 반영되지 않습니다.
+
+        Args:
+            entity_id (int): discord 사용자 ID
+            amount (int): 증감할 금액
+
+        Returns:
+            bool: 계정이 존재하여 반영되었는지 여부
+        """
+        result = cast(CursorResult[Any], await self.session.execute(
+            _ADD_BALANCE,
+            {"entity_id": entity_id, "amount": amount},
+            execution_options={"synchronize_session": False},
+        ))
+        return result.rowcount > 0
+
+    async def check_in(self, entity_id: int, timestamp: int, reward: int = 0) -> bool:
+        """|coro|
+
+        출석체크 시간을 기록하고 보상을 지급합니다.
+
+        `timestamp`가 속한 출석체크 주기(`AccountInfo.CHECK_IN_PERIOD`)에 이미 출석체크한 경우,
+        또는 더 최근 주기에 출석체크한 경우에는 반영되지 않습니다.
+        세션에 로드된 AccountInfo 객체에는 반영되지 않습니다.
+
+        Args:
+            entity_id (int): discord 사용자 ID
+            timestamp (int): 출석체크 시간
+            reward (int, optional): 출석체크 보상 금액. Defaults to 0.
+
+        Returns:
+            bool: 출석체크가 반영되었는지 여부. 계정이 없거나 이미 출석체크한 경우 False
+        """
+        offset = AccountInfo.CHECK_IN_UTC_OFFSET
+        period_start = (timestamp + offset) // AccountInfo.CHECK_IN_PERIOD * AccountInfo.CHECK_IN_PERIOD - offset
+        result = cast(CursorResult[Any], await self.session.execute(
+            _CHECK_IN,
+            {"entity_id": entity_id, "timestamp": timestamp, "reward": reward, "period_start": period_start},
+            execution_options={"synchronize_session": False},
+        ))
+        return result.rowcount > 0
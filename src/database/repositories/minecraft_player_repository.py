@@ -1,10 +1,14 @@
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Sequence
 
 from ..interfaces import IRepository
 from ..models import MinecraftPlayerInfo
 
+_SELECT_BY_ID = select(MinecraftPlayerInfo).filter(MinecraftPlayerInfo.discord_user_id == bindparam("entity_id"))
+_SELECT_PAGE = select(MinecraftPlayerInfo).offset(bindparam("skip")).limit(bindparam("limit"))
+_SELECT_FROM = select(MinecraftPlayerInfo).offset(bindparam("skip"))
+
 
 class MinecraftPlayerRepository(IRepository[MinecraftPlayerInfo]):
     """MinecraftPlayerInfo 데이터베이스 Repository 클래스
@@ -27,9 +31,7 @@ class MinecraftPlayerRepository(IRepository[MinecraftPlayerInfo]):
         Returns:
             Optional[MinecraftPlayerInfo]: 데이터
         """
-        result = await self.session.execute(
-            select(MinecraftPlayerInfo).filter(MinecraftPlayerInfo.discord_user_id == entity_id)
-        )
+        result = await self.session.execute(_SELECT_BY_ID, {"entity_id": entity_id})
         return result.scalars().first()
 
     async def get_all(self, skip: int = 0, limit: Optional[int] = 100) -> Sequence[MinecraftPlayerInfo]:
@@ -44,9 +46,10 @@ class MinecraftPlayerRepository(IRepository[MinecraftPlayerInfo]):
         Returns:
             Sequence[MinecraftPlayerInfo]: 모든 데이터
         """
-        result = await self.session.execute(
-            select(MinecraftPlayerInfo).offset(skip).limit(limit)
-        )
+        if limit is None:
+            result = await self.session.execute(_SELECT_FROM, {"skip": skip})
+        else:
+            result = await self.session.execute(_SELECT_PAGE, {"skip": skip, "limit": limit})
         return result.scalars().all()
 
     def add(self, entity: MinecraftPlayerInfo):
@@ -1,10 +1,23 @@
-from sqlalchemy import select
+from sqlalchemy import select, delete, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Iterable
 
 from ..interfaces import IRepository
 from ..models import UserInfo
 
+_SELECT_BY_ID = select(UserInfo).filter(UserInfo.discord_user_id == bindparam("entity_id"))
+_SELECT_BY_MC_NAME = select(UserInfo).filter(UserInfo.minecraft_player.has(minecraft_username=bindparam("mc_name")))
+_SELECT_MANY = select(UserInfo).filter(UserInfo.discord_user_id.in_(bindparam("entity_ids", expanding=True)))
+_SELECT_IDS_AFTER = (
+    select(UserInfo.discord_user_id)
+    .filter(UserInfo.discord_user_id > bindparam("after_id"))
+    .order_by(UserInfo.discord_user_id)
+    .limit(bindparam("limit"))
+)
+_DELETE_MANY = delete(UserInfo).filter(UserInfo.discord_user_id.in_(bindparam("entity_ids", expanding=True)))
+_SELECT_PAGE = select(UserInfo).offset(bindparam("skip")).limit(bindparam("limit"))
+_SELECT_FROM = select(UserInfo).offset(bindparam("skip"))
+
 
 class UserRepository(IRepository[UserInfo]):
     """UserInfo 데이터베이스 Repository 클래스
@@ -27,11 +40,43 @@ class UserRepository(IRepository[UserInfo]):
         Returns:
             Optional[UserInfo]: 데이터
         """
-        result = await self.session.execute(
-            select(UserInfo).filter(UserInfo.discord_user_id == entity_id)
-        )
+        result = await self.session.execute(_SELECT_BY_ID, {"entity_id": entity_id})
         return result.scalars().first()
 
+    async def get_many(self, entity_ids: Iterable[int]) -> Sequence[UserInfo]:
+        """|coro|
+
+        여러 entity_id의 데이터를 한 번에 가져옵니다.
+
+        Args:
+            entity_ids (Iterable[int]): discord 사용자 ID 목록
+
+        Returns:
+            Sequence[UserInfo]: DB에 존재하는 데이터
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return []
+        result = await self.session.execute(_SELECT_MANY, {"entity_ids": entity_ids})
+        return result.scalars().all()
+
+    async def get_ids_after(self, after_id: int = 0, limit: int = 100) -> Sequence[int]:
+        """|coro|
+
+        `after_id`보다 큰 discord 사용자 ID를 오름차순으로 가져옵니다.
+
+        전체 테이블을 메모리에 올리지 않고 순회할 때 사용합니다.
+
+        Args:
+            after_id (int, optional): 마지막으로 가져온 discord 사용자 ID. Defaults to 0.
+            limit (int, optional): 최대 데이터 수. Defaults to 100.
+
+        Returns:
+            Sequence[int]: discord 사용자 ID 목록
+        """
+        result = await self.session.execute(_SELECT_IDS_AFTER, {"after_id": after_id, "limit": limit})
+        return result.scalars().all()
+
     async def get_by_mc_name(self, mc_name: str) -> Optional[UserInfo]:
         """|coro|
 
@@ -43,9 +88,7 @@ class UserRepository(IRepository[UserInfo]):
         Returns:
             Optional[UserInfo]: 데이터
         """
-        result = await self.session.execute(
-            select(UserInfo).filter(UserInfo.minecraft_player.has(minecraft_username=mc_name))
-        )
+        result = await self.session.execute(_SELECT_BY_MC_NAME, {"mc_name": mc_name})
         return result.scalars().first()
 
     async def get_all(self, skip: int = 0, limit: Optional[int] = 100) -> Sequence[UserInfo]:
@@ -60,9 +103,10 @@ class UserRepository(IRepository[UserInfo]):
         Returns:
             Sequence[UserInfo]: 모든 데이터
         """
-        result = await self.session.execute(
-            select(UserInfo).offset(skip).limit(limit)
-        )
+        if limit is None:
+            result = await self.session.execute(_SELECT_FROM, {"skip": skip})
+        else:
+            result = await self.session.execute(_SELECT_PAGE, {"skip": skip, "limit": limit})
         return result.scalars().all()
 
     def add(self, entity: UserInfo):
@@ -73,6 +117,14 @@ class UserRepository(IRepository[UserInfo]):
         """
         self.session.add(entity)
 
+    def add_many(self, entities: Iterable[UserInfo]):
+        """여러 데이터를 한 번에 추가합니다.
+
+        Args:
+            entities (Iterable[UserInfo]): 추가할 데이터
+        """
+        self.session.add_all(entities)
+
     async def update(self, entity: UserInfo):
         """|coro|
 
@@ -92,3 +144,22 @@ class UserRepository(IRepository[UserInfo]):
             entity (UserInfo): 삭제할 데이터
         """
         await self.session.delete(entity)
+
+    async def delete_many(self, entity_ids: Iterable[int]):
+        """|coro|
+
+        여러 entity_id의 데이터를 한 번에 삭제합니다.
+
+        연관된 account_info, minecraft_player_info는 DB의 외래 키 설정에 따라 함께 삭제되므로 사용자의 잔액도 사라집니다.
+
+        Args:
+            entity_ids (Iterable[int]): 삭제할 discord 사용자 ID 목록
+        """
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return
+        await self.session.execute(
+            _DELETE_MANY,
+            {"entity_ids": entity_ids},
+            execution_options={"synchronize_session": False},
+        )
@@ -0,0 +1,198 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("discord.database.routing")
+
+LagProbe = Callable[[AsyncEngine], Awaitable[float]]
+
+
+async def measure_replica_lag(engine: AsyncEngine) -> float:
+    """|coro|
+
+    복제본의 복제 지연 시간(초)을 측정합니다.
+
+    MySQL이 아닌 데이터베이스(예: 로컬 테스트용 SQLite)는 지연이 없는 것으로 간주합니다.
+
+    Args:
+        engine (AsyncEngine): 복제본 엔진
+
+    Returns:
+        float: 복제 지연 시간(초). 복제가 중단된 경우 `math.inf`
+    """
+    if engine.dialect.name != "mysql":
+        return 0.0
+
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SHOW REPLICA STATUS"))
+            column = "Seconds_Behind_Source"
+        except SQLAlchemyError:
+            # MySQL 8.0.22 미만
+            result = await conn.execute(text("SHOW SLAVE STATUS"))
+            column = "Seconds_Behind_Master"
+        row = result.mappings().first()
+
+    if row is None: # 복제 설정이 없는 서버
+        return 0.0
+    if row[column] is None: # 복제 스레드가 멈춘 상태
+        return math.inf
+    return float(row[column])
+
+
+@dataclass
+class ReplicaState:
+    """복제본 엔진의 상태
+
+    Attributes:
+        engine (AsyncEngine): 복제본 엔진
+        lag (Optional[float]): 마지막으로 측정한 복제 지연 시간(초). 측정 전이거나 실패한 경우 None
+        checked_at (float): 마지막으로 지연 시간을 측정한 시각 (`time.monotonic()`)
+    """
+    engine: AsyncEngine
+    lag: Optional[float] = None
+    checked_at: float = 0.0
+
+
+class ReplicaRouter:
+    """읽기 전용 세션을 복제본으로, 쓰기 세션을 primary로 라우팅하는 클래스
+
+    복제 지연이 `max_lag`를 넘는 복제본은 사용하지 않으며,
+    사용자가 쓰기를 한 뒤 `sticky_window`초 동안은 해당 사용자의 읽기를 primary로 보냅니다. (read-your-writes)
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        max_lag: float = 5.0,
+        sticky_window: float = 5.0,
+        lag_check_interval: float = 10.0,
+        lag_probe: LagProbe = measure_replica_lag,
+    ):
+        """ReplicaRouter 클래스 생성자
+
+        Args:
+            primary (AsyncEngine): 쓰기용 primary 엔진
+            replicas (Sequence[AsyncEngine]): 읽기용 복제본 엔진 목록
+            max_lag (float, optional): 허용하는 최대 복제 지연 시간(초). Defaults to 5.0.
+            sticky_window (float, optional): 쓰기 후 primary에서 읽는 시간(초). Defaults to 5.0.
+            lag_check_interval (float, optional): 복제 지연 측정 주기(초). Defaults to 10.0.
+            lag_probe (LagProbe, optional): 복제 지연 측정 함수. Defaults to measure_replica_lag.
+        """
+        self.primary = primary
+        self.replicas = [ReplicaState(engine) for engine in replicas]
+        self.max_lag = max_lag
+        self.sticky_window = sticky_window
+        self.lag_check_interval = lag_check_interval
+        self.lag_probe = lag_probe
+
+        self._round_robin = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._sticky_until: dict[int, float] = {}
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+
+    def mark_write(self, user_id: int):
+        """사용자가 쓰기를 했음을 기록합니다.
+
+        Args:
+            user_id (int): discord 사용자 ID
+        """
+        now = time.monotonic()
+        self._sticky_until[user_id] = now + self.sticky_window
+
+        # 만료된 항목 정리
+        if len(self._sticky_until) > 1024:
+            self._sticky_until = {uid: t for uid, t in self._sticky_until.items() if t > now}
+
+    def is_sticky(self, user_id: int) -> bool:
+        """사용자의 읽기를 primary로 보내야 하는지 확인합니다."""
+        until = self._sticky_until.get(user_id)
+        return until is not None and until > time.monotonic()
+
+    def select_engine(self, user_id: Optional[int] = None) -> AsyncEngine:
+        """읽기 전용 세션에 사용할 엔진을 선택합니다.
+
+        사용 가능한 복제본이 없으면 primary 엔진을 반환합니다.
+
+        Args:
+            user_id (Optional[int], optional): discord 사용자 ID. Defaults to None.
+
+        Returns:
+            AsyncEngine: 선택된 엔진
+        """
+        if self._round_robin is None:
+            return self.primary
+
+        self._schedule_refresh()
+
+        if user_id is not None and self.is_sticky(user_id):
+            return self.primary
+
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._round_robin)]
+            if replica.lag is not None and replica.lag <= self.max_lag:
+                return replica.engine
+
+        return self.primary
+
+    def mark_unhealthy(self, engine: AsyncEngine):
+        """복제본에 연결할 수 없음을 기록합니다.
+
+        다음 복제 지연 측정에 성공할 때까지 해당 복제본으로 라우팅하지 않습니다.
+
+        Args:
+            engine (AsyncEngine): 연결에 실패한 복제본 엔진
+        """
+        for replica in self.replicas:
+            if replica.engine is engine and replica.lag is not None:
+                replica.lag = None
+                replica.checked_at = time.monotonic()
+                logger.warning(f"Replica {engine.url!r} is unreachable, routing reads to other databases")
+
+    async def refresh_lag(self):
+        """|coro|
+
+        모든 복제본의 복제 지연 시간을 측정합니다.
+        """
+        async def probe(replica: ReplicaState):
+            try:
+                replica.lag = await self.lag_probe(replica.engine)
+            except Exception as e:
+                replica.lag = None
+                logger.warning(f"Failed to measure replica lag of {replica.engine.url!r}: {e}")
+            else:
+                if replica.lag > self.max_lag:
+                    logger.warning(f"Replica {replica.engine.url!r} is lagging {replica.lag}s behind")
+            finally:
+                replica.checked_at = time.monotonic()
+
+        await asyncio.gather(*(probe(replica) for replica in self.replicas))
+
+    def _schedule_refresh(self):
+        """측정 주기가 지났으면 백그라운드에서 복제 지연을 측정합니다."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        now = time.monotonic()
+        if all(now - replica.checked_at < self.lag_check_interval for replica in self.replicas):
+            return
+
+        self._refresh_task = asyncio.get_running_loop().create_task(self.refresh_lag())
+
+    async def close(self):
+        """|coro|
+
+        진행 중인 측정 작업을 취소하고 복제본 엔진을 종료합니다.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for replica in self.replicas:
+            await replica.engine.dispose()
@@ -0,0 +1,158 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncGenerator, Optional
+
+
+class Priority(Enum):
+    """DB 커넥션 사용 우선순위"""
+    INTERACTIVE = "interactive" # 사용자 명령어
+    BACKGROUND = "background"   # 동기화, journal 반영 등 백그라운드 작업
+
+
+class QueueWaitStats:
+    """우선순위별 커넥션 대기 시간 통계
+
+    Attributes:
+        count (int): 커넥션을 얻은 횟수
+        total_wait (float): 총 대기 시간(초)
+        max_wait (float): 최대 대기 시간(초)
+    """
+
+    def __init__(self, sample_size: int = 1024):
+        self.count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def record(self, wait: float):
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._samples.append(wait)
+
+    @property
+    def mean_wait(self) -> float:
+        """평균 대기 시간(초)"""
+        return self.total_wait / self.count if self.count else 0.0
+
+    @property
+    def samples(self) -> list[float]:
+        """최근 대기 시간(초) 목록"""
+        return list(self._samples)
+
+    def percentile(self, p: float) -> float:
+        """최근 대기 시간의 백분위수(초)를 반환합니다.
+
+        Args:
+            p (float): 백분위 (0 ~ 100)
+        """
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, math.ceil(p / 100 * len(samples)) - 1)]
+
+
+class ConnectionScheduler:
+    """커넥션 풀 사용량을 우선순위별로 나누는 클래스
+
+    전체 `capacity` 중 `interactive_reserve`개는 사용자 명령어(INTERACTIVE)만 사용할 수 있으므로,
+    백그라운드 작업이 커넥션을 모두 점유해도 사용자 명령어는 대기하지 않습니다.
+    빈 자리가 생기면 대기 중인 INTERACTIVE 요청에 먼저 할당합니다.
+    """
+
+    def __init__(self, capacity: int, interactive_reserve: int):
+        """ConnectionScheduler 클래스 생성자
+
+        Args:
+            capacity (int): 동시에 사용할 수 있는 최대 커넥션 수
+            interactive_reserve (int): INTERACTIVE 전용으로 남겨둘 커넥션 수
+        """
+        if not 0 <= interactive_reserve < capacity:
+            raise ValueError("interactive_reserve must be between 0 and capacity - 1")
+
+        self.capacity = capacity
+        self.interactive_reserve = interactive_reserve
+        self.stats = {priority: QueueWaitStats() for priority in Priority}
+
+        self._in_use = 0
+        self._background_in_use = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {priority: deque() for priority in Priority}
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> AsyncGenerator[None, None]:
+        """커넥션을 사용할 자리를 얻는 컨텍스트 매니저입니다.
+
+        Args:
+            priority (Priority, optional): 우선순위. Defaults to Priority.INTERACTIVE.
+            timeout (Optional[float], optional): 최대 대기 시간(초). Defaults to None.
+
+        Raises:
+            TimeoutError: `timeout` 안에 자리를 얻지 못한 경우
+        """
+        started_at = time.perf_counter()
+        async with asyncio.timeout(timeout):
+            await self._acquire(priority)
+        self.stats[priority].record(time.perf_counter() - started_at)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def reset_stats(self):
+        """대기 시간 통계를 초기화합니다."""
+        self.stats = {priority: QueueWaitStats() for priority in Priority}
+
+    def _can_acquire(self, priority: Priority) -> bool:
+        if self._in_use >= self.capacity:
+            return False
+        if priority is Priority.BACKGROUND:
+            return self._background_in_use < self.capacity - self.interactive_reserve
+        return True
+
+    def _grant(self, priority: Priority):
+        self._in_use += 1
+        if priority is Priority.BACKGROUND:
+            self._background_in_use += 1
+
+    async def _acquire(self, priority: Priority):
+        # 먼저 대기 중인 요청이 없을 때만 바로 할당 (INTERACTIVE 대기 요청이 있으면 BACKGROUND는 대기)
+        waiting_ahead = self._waiters[priority] or (
+            priority is Priority.BACKGROUND and self._waiters[Priority.INTERACTIVE]
+        )
+        if not waiting_ahead and self._can_acquire(priority):
+            self._grant(priority)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled(): # 할당된 직후 취소된 경우
+                self._release(priority)
+            elif waiter in self._waiters[priority]:
+                self._waiters[priority].remove(waiter)
+            raise
+
+    def _release(self, priority: Priority):
+        self._in_use -= 1
+        if priority is Priority.BACKGROUND:
+            self._background_in_use -= 1
+        self._wake()
+
+    def _wake(self):
+        for priority in (Priority.INTERACTIVE, Priority.BACKGROUND):
+            waiters = self._waiters[priority]
+            while waiters and self._can_acquire(priority):
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self._grant(priority)
+                    waiter.set_result(None)
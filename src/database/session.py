@@ -1,11 +1,14 @@
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, Hashable, Optional, Sequence, cast
 
+from sqlalchemy import event
 from sqlalchemy.engine.url import URL
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     async_scoped_session,
@@ -13,6 +16,15 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import declarative_base
 
+from .routing import ReplicaRouter
+from .scheduler import ConnectionScheduler, Priority
+from .circuit_breaker import (
+    CONNECTION_ERRORS,
+    CircuitBreaker,
+    DatabaseUnavailableError,
+    StaleReadCache,
+)
+
 logger = logging.getLogger("discord.database.session")
 Base = declarative_base()
 
@@ -28,6 +40,14 @@ class DiscraftDBConnection:
         port: int,
         database: str,
         drivername: str = "mysql+aiomysql",
+        replica_urls: Sequence[str | URL] = (),
+        max_replica_lag: float = 5.0,
+        sticky_window: float = 5.0,
+        query_cache_size: int = 500,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 10.0,
+        interactive_reserve: int = 5,
     ):
         """DatabaseConnection 클래스 생성자
 
@@ -38,7 +58,27 @@ class DiscraftDBConnection:
             host (str): database 호스트 주소
             port (int): database 포트
             database (str): database 이름
+            replica_urls (Sequence[str | URL], optional): 읽기 전용 복제본 URL 목록. Defaults to ().
+            max_replica_lag (float, optional): 읽기에 사용할 복제본의 최대 복제 지연 시간(초). Defaults to 5.0.
+            sticky_window (float, optional): 사용자가 쓰기를 한 뒤 primary에서 읽는 시간(초). Defaults to 5.0.
+            query_cache_size (int, optional): 엔진별 컴파일된 SQL 캐시 크기. 0이면 캐시를 사용하지 않습니다. Defaults to 500.
+            pool_size (int, optional): 커넥션 풀에 유지할 커넥션 수. Defaults to 5.
+            max_overflow (int, optional): `pool_size`를 넘어 추가로 만들 수 있는 커넥션 수. Defaults to 10.
+            pool_timeout (float, optional): 커넥션 풀에서 커넥션을 기다리는 최대 시간(초). Defaults to 10.0.
+            interactive_reserve (int, optional): 사용자 명령어(INTERACTIVE) 전용으로 남겨둘 커넥션 수.
+                최대 커넥션 수(`pool_size + max_overflow`)보다 1 작은 값까지만 사용됩니다. Defaults to 5.
+
+        Raises:
+            ValueError: 커넥션 풀 설정이 올바르지 않은 경우
         """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+        if max_overflow < 0:
+            # 우선순위 스케줄러가 최대 커넥션 수를 알아야 하므로 무제한(-1)은 사용할 수 없음
+            raise ValueError(f"max_overflow must be 0 or greater, got {max_overflow}")
+        if interactive_reserve < 0:
+            raise ValueError(f"interactive_reserve must be 0 or greater, got {interactive_reserve}")
+
         self.connection_string = URL.create(
             drivername=drivername,
             username=username,
@@ -47,10 +87,65 @@ class DiscraftDBConnection:
             port=port,
             database=database,
         )
+        self.replica_urls = list(replica_urls)
+        self.max_replica_lag = max_replica_lag
+        self.sticky_window = sticky_window
+        self.query_cache_size = query_cache_size
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        # 백그라운드 작업이 사용할 커넥션을 최소 1개 남김
+        self.interactive_reserve = min(interactive_reserve, pool_size + max_overflow - 1)
+
+        # DB 장애 시 요청을 즉시 실패시키고 캐시된 읽기 결과를 제공
+        self.breaker = CircuitBreaker()
+        self.read_cache = StaleReadCache()
 
         self.engine = None
         self.session_factory = None
         self.session = None
+        self.router: Optional[ReplicaRouter] = None
+
+        # 엔진별 우선순위 스케줄러
+        self.schedulers: dict[AsyncEngine, ConnectionScheduler] = {}
+
+    def _create_engine(self, url: str | URL) -> AsyncEngine:
+        """커넥션 풀 설정이 적용된 엔진을 생성합니다."""
+        engine = create_async_engine(
+            url,
+
+            # SQL 문을 출력 (디버깅용)
+            echo=__debug__ and logging.getLogger().level <= logging.DEBUG,
+
+            # 커넥션 풀 설정
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+
+            # 커넥션이 유효한지 확인
+            pool_pre_ping=True,
+
+            # 컴파일된 SQL 캐시 크기
+            query_cache_size=self.query_cache_size,
+        )
+        self.schedulers[engine] = ConnectionScheduler(
+            capacity=self.pool_size + self.max_overflow,
+            interactive_reserve=self.interactive_reserve,
+        )
+        return engine
+
+    def _track_latency(self, engine: AsyncEngine):
+        """엔진의 쿼리 실행 시간을 circuit breaker에 기록합니다."""
+        def before_cursor_execute(conn, *args):
+            conn.info["query_started_at"] = time.perf_counter()
+
+        def after_cursor_execute(conn, *args):
+            started_at = conn.info.pop("query_started_at", None)
+            if started_at is not None:
+                self.breaker.record_latency(time.perf_counter() - started_at)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
 
     async def initialize(self):
         """database에 연결합니다.
@@ -59,19 +154,9 @@ class DiscraftDBConnection:
         """
         logger.info(f"Initializing database connection to {self.connection_string}")
         try:
-            self.engine = create_async_engine(
-                self.connection_string,
-
-                # SQL 문을 출력 (디버깅용)
-                echo=__debug__ and logging.getLogger().level <= logging.DEBUG,
-
-                # 커넥션 풀 설정
-                pool_size=5,
-                max_overflow=10,
-
-                # 커넥션이 유효한지 확인
-                pool_pre_ping=True,
-            )
+            self.engine = self._create_engine(self.connection_string)
+            self._track_latency(self.engine)
+            replicas = [self._create_engine(url) for url in self.replica_urls]
         except SQLAlchemyError as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
@@ -90,6 +175,16 @@ class DiscraftDBConnection:
         )
         self.session = async_scoped_session(self.session_factory, scopefunc=asyncio.current_task)
 
+        # 읽기 전용 세션 라우팅
+        self.router = ReplicaRouter(
+            self.engine,
+            replicas,
+            max_lag=self.max_replica_lag,
+            sticky_window=self.sticky_window,
+        )
+        if replicas:
+            logger.info(f"Routing read-only sessions to {len(replicas)} replica(s)")
+
     async def get_session(self) -> AsyncSession:
         """비동기 세션을 반환합니다.
 
@@ -102,32 +197,158 @@ class DiscraftDBConnection:
             raise RuntimeError("DatabaseConnection not initialized. Call initialize() first.")
         return self.session()
 
+    async def get_read_session(self, user_id: Optional[int] = None) -> AsyncSession:
+        """읽기 전용 비동기 세션을 반환합니다.
+
+        세션을 사용한 후에는 반드시 `close()`를 호출해야 합니다.
+
+        Args:
+            user_id (Optional[int], optional): 세션을 사용하는 discord 사용자 ID. Defaults to None.
+
+        Returns:
+            AsyncSession: 복제본 또는 primary에 연결된 비동기 세션
+        """
+        if self.session_factory is None or self.router is None:
+            raise RuntimeError("DatabaseConnection not initialized. Call initialize() first.")
+        return self.session_factory(bind=self.router.select_engine(user_id))
+
     @asynccontextmanager
-    async def session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+    async def session_scope(
+        self,
+        *,
+        read_only: bool = False,
+        user_id: Optional[int] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> AsyncGenerator[AsyncSession, None]:
         """비동기 세션을 사용하는 컨텍스트 매니저입니다.
 
+        `read_only=True`인 경우 복제 지연이 허용 범위 안인 복제본에 연결된 세션을 반환합니다.
+        `user_id`를 지정하면 해당 사용자가 최근에 쓰기를 한 경우 primary에서 읽습니다.
+
+        primary DB에 장애가 발생해 circuit breaker가 열려 있으면 커넥션을 기다리지 않고 즉시 실패합니다.
+
+        세션은 `priority`에 따라 커넥션 풀의 자리를 얻은 뒤 반환되며,
+        백그라운드 작업(`Priority.BACKGROUND`)은 사용자 명령어 전용으로 남겨둔 자리를 사용할 수 없습니다.
+
+        Args:
+            read_only (bool, optional): 읽기 전용 세션 여부. Defaults to False.
+            user_id (Optional[int], optional): 세션을 사용하는 discord 사용자 ID. Defaults to None.
+            priority (Priority, optional): 커넥션 사용 우선순위. Defaults to Priority.INTERACTIVE.
+
+        Raises:
+            DatabaseUnavailableError: primary DB의 circuit breaker가 열려 있는 경우
+
         Examples:
         ```python
         db = DatabaseConnection(...)
         async with db.session_scope() as session:
             async with session.begin():  # transaction 시작
                 ... # session을 사용하는 코드
+
+        async with db.session_scope(read_only=True, user_id=ctx.author.id) as session:
+            user = await UserRepository(session).get_by_id(ctx.author.id)
         ```
         """
-        session = await self.get_session()
+        if read_only:
+            session = await self.get_read_session(user_id)
+            uses_primary = session.bind is self.engine
+            if uses_primary:
+                try:
+                    self.breaker.before_call()
+                except DatabaseUnavailableError:
+                    await session.close()
+                    raise
+        else:
+            self.breaker.before_call()
+            session = await self.get_session()
+            uses_primary = True
+
+        # get_session(), get_read_session()의 세션은 항상 엔진에 연결됨
+        engine = cast(AsyncEngine, session.bind)
         try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
+            # 사용자 명령어는 pool_timeout까지만 대기
+            timeout = self.pool_timeout if priority is Priority.INTERACTIVE else None
+            async with self.schedulers[engine].slot(priority, timeout):
+                # 커넥션을 반환한 뒤에 자리를 넘겨주도록 자리를 가진 동안 rollback, close
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+                finally:
+                    await session.close()
+            if not read_only and user_id is not None and self.router is not None:
+                self.router.mark_write(user_id)
+        except Exception as e:
+            if isinstance(e, CONNECTION_ERRORS):
+                if uses_primary:
+                    self.breaker.record_failure()
+                elif self.router is not None:
+                    self.router.mark_unhealthy(engine)
             raise
+        else:
+            if uses_primary:
+                self.breaker.record_success()
         finally:
+            # 자리를 얻지 못한 경우
             await session.close()
 
+    async def cached_read[T](
+        self,
+        key: Hashable,
+        loader: Callable[[AsyncSession], Awaitable[T]],
+        *,
+        user_id: Optional[int] = None,
+    ) -> T:
+        """|coro|
+
+        읽기 전용 세션으로 데이터를 읽고 결과를 캐시합니다.
+
+        DB 장애로 읽을 수 없으면 같은 `key`로 캐시된 마지막 결과를 반환합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            loader (Callable[[AsyncSession], Awaitable[T]]): 세션을 받아 데이터를 읽는 함수
+            user_id (Optional[int], optional): 세션을 사용하는 discord 사용자 ID. Defaults to None.
+
+        Raises:
+            DatabaseUnavailableError: DB 장애 중이며 캐시된 결과가 없는 경우
+
+        Returns:
+            T: 읽은 데이터
+
+        Examples:
+        ```python
+        user = await db.cached_read(
+            ("user", ctx.author.id),
+            lambda session: UserRepository(session).get_by_id(ctx.author.id),
+            user_id=ctx.author.id,
+        )
+        ```
+        """
+        try:
+            async with self.session_scope(read_only=True, user_id=user_id) as session:
+                value = await loader(session)
+        except (DatabaseUnavailableError, *CONNECTION_ERRORS) as e:
+            cached = self.read_cache.get(key)
+            if cached is None:
+                if isinstance(e, DatabaseUnavailableError):
+                    raise
+                raise DatabaseUnavailableError("Database is unavailable and no cached value exists") from e
+            logger.debug(f"Serving cached read for {key!r}")
+            return cached
+
+        self.read_cache.set(key, value)
+        return value
+
     async def close(self):
         """database 연결을 종료합니다."""
         if self.engine is not None:
             logger.info(f"Closing database connection to {self.connection_string}")
+            if self.router is not None:
+                await self.router.close()
             await self.engine.dispose()
+            self.schedulers.clear()
         else:
             logger.warning("Database connection is not initialized")
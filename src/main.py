@@ -3,7 +3,16 @@ from discord.ext import commands
 
 from src.config import ENV
 from src.classes.bot import Bot
+from src.utils.speedups import install_speedups
 
 
+# bot.run()은 로깅을 설정하기 전에 출력된 로그를 표시하지 않으므로 먼저 설정
+discord.utils.setup_logging()
+
+if ENV.DISCORD_BOT_RUNTIME_MODE == "speedups":
+    install_speedups()
+elif ENV.DISCORD_BOT_RUNTIME_MODE not in (None, "default"):
+    raise ValueError(f"지원하지 않는 DISCORD_BOT_RUNTIME_MODE 값입니다: {ENV.DISCORD_BOT_RUNTIME_MODE}")
+
 bot = Bot()
-bot.run(ENV.DISCORD_BOT_TOKEN)
+bot.run(ENV.DISCORD_BOT_TOKEN, log_handler=None)
@@ -0,0 +1,76 @@
+import discord
+import discord.gateway
+import discord.utils
+
+import asyncio
+import importlib
+import logging
+from types import ModuleType
+from typing import Any, Optional
+
+logger = logging.getLogger("discord.utils.speedups")
+
+# uninstall_speedups()로 되돌리기 위해 install_speedups() 적용 전의 값을 저장
+_originals: dict[str, Any] = {}
+
+# discord.gateway가 zlib-stream 압축 해제에 사용하는 모듈 속성 (공개 API가 아니므로 getattr/setattr로 접근)
+_GATEWAY_ZLIB = "zlib"
+
+
+def _try_import(name: str) -> Optional[ModuleType]:
+    """모듈을 가져옵니다. 설치되어 있지 않으면 None을 반환합니다."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def install_speedups() -> list[str]:
+    """설치되어 있는 가속 모듈을 적용합니다.
+
+    `bot.run()`으로 이벤트 루프가 생성되기 전에 호출해야 합니다.
+
+    - uvloop: asyncio 이벤트 루프
+    - zlib-ng: gateway zlib-stream 압축 해제
+    - orjson: gateway payload JSON 디코딩. discord.py가 설치 여부를 확인해 직접 사용하므로 적용 여부만 기록합니다.
+
+    Returns:
+        list[str]: 적용된 가속 모듈 이름
+    """
+    active: list[str] = []
+    missing: list[str] = []
+
+    uvloop = _try_import("uvloop")
+    if uvloop is not None:
+        _originals.setdefault("event_loop_policy", asyncio.get_event_loop_policy())
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        active.append("uvloop")
+    else:
+        missing.append("uvloop")
+
+    if discord.utils.HAS_ORJSON:
+        active.append("orjson")
+    else:
+        missing.append("orjson")
+
+    zlib_ng = _try_import("zlib_ng.zlib_ng")
+    if zlib_ng is not None:
+        _originals.setdefault("zlib", getattr(discord.gateway, _GATEWAY_ZLIB))
+        setattr(discord.gateway, _GATEWAY_ZLIB, zlib_ng)
+        active.append("zlib-ng")
+    else:
+        missing.append("zlib-ng")
+
+    logger.info(f"Speedups active: {', '.join(active) or 'none'}")
+    if missing:
+        logger.info(f"Speedups not installed: {', '.join(missing)}")
+
+    return active
+
+
+def uninstall_speedups():
+    """`install_speedups()`로 적용한 가속 모듈을 적용 전의 상태로 되돌립니다."""
+    if "event_loop_policy" in _originals:
+        asyncio.set_event_loop_policy(_originals.pop("event_loop_policy"))
+    if "zlib" in _originals:
+        setattr(discord.gateway, _GATEWAY_ZLIB, _originals.pop("zlib"))
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import DiscraftDBConnection
+from src.database.session import Base
+
+DatabaseFactory = Callable[..., Awaitable[DiscraftDBConnection]]
+
+
+async def create_tables(url: str):
+    """`url`의 SQLite 파일에 모든 테이블을 생성합니다."""
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+def sqlite_url(path: Path) -> str:
+    return f"sqlite+aiosqlite:///{path}"
+
+
+@pytest_asyncio.fixture
+async def make_database(tmp_path: Path) -> AsyncIterator[DatabaseFactory]:
+    """테이블이 생성된 로컬 SQLite 파일에 연결된 DiscraftDBConnection을 만드는 fixture
+
+    만든 연결은 테스트가 끝나면 종료됩니다.
+    """
+    databases: list[DiscraftDBConnection] = []
+
+    async def factory(name: str = "primary", **kwargs) -> DiscraftDBConnection:
+        path = tmp_path / f"{name}.db"
+        await create_tables(sqlite_url(path))
+        db = DiscraftDBConnection(None, None, None, None, str(path), drivername="sqlite+aiosqlite", **kwargs)
+        await db.initialize()
+        databases.append(db)
+        return db
+
+    yield factory
+
+    for db in databases:
+        await db.close()
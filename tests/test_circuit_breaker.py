@@ -0,0 +1,51 @@
+"""`CircuitBreaker`의 상태 전이를 확인합니다."""
+import pytest
+
+from src.database.circuit_breaker import CircuitBreaker, CircuitState, DatabaseUnavailableError
+
+
+def test_opens_after_failure_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.before_call()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(DatabaseUnavailableError):
+        breaker.before_call()
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker(failure_threshold=2, slow_call_threshold=1.0)
+    breaker.record_latency(0.5)
+    breaker.record_latency(1.5)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_latency(2.0)
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_half_open_probe_closes_and_notifies_listeners():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    closed = []
+    breaker.add_close_listener(lambda: closed.append(True))
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert closed == [True]
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
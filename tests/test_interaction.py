@@ -0,0 +1,87 @@
+"""`auto_defer`가 커맨드 결과에 따라 interaction에 응답하는지 확인합니다."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.classes.interaction import DONE_MESSAGE, ERROR_MESSAGE, auto_defer, get_responder
+
+
+def make_interaction() -> MagicMock:
+    interaction = MagicMock(spec=discord.Interaction)
+    interaction.extras = {}
+    interaction.client = MagicMock(spec=[])
+    interaction.command = None
+
+    done = False
+
+    def is_done() -> bool:
+        return done
+
+    async def respond(*args, **kwargs):
+        nonlocal done
+        done = True
+
+    interaction.response.is_done.side_effect = is_done
+    interaction.response.defer = AsyncMock(side_effect=respond)
+    interaction.response.send_message = AsyncMock(side_effect=respond)
+    interaction.followup.send = AsyncMock()
+    interaction.edit_original_response = AsyncMock()
+    return interaction
+
+
+@pytest.mark.asyncio
+async def test_fast_command_sends_buffered_messages_once():
+    @auto_defer()
+    async def command(interaction):
+        await get_responder(interaction).send("a")
+        await get_responder(interaction).send("b")
+
+    interaction = make_interaction()
+    await command(interaction)
+
+    interaction.response.defer.assert_not_awaited()
+    interaction.response.send_message.assert_awaited_once()
+    assert interaction.response.send_message.await_args.kwargs["content"] == "a\nb"
+
+
+@pytest.mark.asyncio
+async def test_deferred_command_without_output_edits_thinking_message():
+    @auto_defer(latency_budget=0.01)
+    async def command(interaction):
+        await asyncio.sleep(0.05)
+
+    interaction = make_interaction()
+    await command(interaction)
+
+    interaction.response.defer.assert_awaited_once()
+    interaction.edit_original_response.assert_awaited_once_with(content=DONE_MESSAGE)
+
+
+@pytest.mark.asyncio
+async def test_deferred_command_error_is_reported_and_reraised():
+    @auto_defer(latency_budget=0.01)
+    async def command(interaction):
+        await get_responder(interaction).send("unsent")
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    interaction = make_interaction()
+    with pytest.raises(ValueError):
+        await command(interaction)
+
+    interaction.followup.send.assert_not_awaited()
+    interaction.edit_original_response.assert_awaited_once_with(content=ERROR_MESSAGE)
+
+
+@pytest.mark.asyncio
+async def test_error_response_failure_does_not_mask_command_error():
+    @auto_defer()
+    async def command(interaction):
+        raise ValueError("boom")
+
+    interaction = make_interaction()
+    interaction.response.send_message.side_effect = discord.InteractionResponded(interaction)
+    with pytest.raises(ValueError):
+        await command(interaction)
@@ -0,0 +1,168 @@
+"""`WriteJournal`과 `EconomyWriter`의 journal 기록 및 반영을 로컬 SQLite 파일로 확인합니다."""
+import time
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from src.database import DiscraftDBConnection, UserInfo, AccountInfo
+from src.database import journal as journal_module
+from src.database.journal import EconomyWriter, JournalEntry, JournalOp, WriteJournal, WriteResult
+from src.database.repositories import AccountRepository
+
+from .conftest import DatabaseFactory
+
+USER = 1
+DAY = AccountInfo.CHECK_IN_PERIOD
+# 출석체크 주기 중간의 시간
+DAY_1 = 100 * DAY + DAY // 2
+DAY_2 = DAY_1 + DAY
+
+
+@pytest_asyncio.fixture
+async def db(make_database: DatabaseFactory) -> DiscraftDBConnection:
+    db = await make_database()
+    async with db.session_scope() as session:
+        session.add(UserInfo(discord_user_id=USER))
+        session.add(AccountInfo(discord_user_id=USER, balance=0, last_check_in=0))
+    return db
+
+
+@pytest_asyncio.fixture
+async def writer(db: DiscraftDBConnection, tmp_path: Path):
+    writer = EconomyWriter(db, WriteJournal(tmp_path / "journal.jsonl"))
+    yield writer
+    await writer.close()
+
+
+async def balance(db: DiscraftDBConnection) -> int:
+    async with db.session_scope() as session:
+        account = await AccountRepository(session).get_by_id(USER)
+    assert account is not None
+    return account.balance
+
+
+def start_outage(db: DiscraftDBConnection):
+    db.breaker.failure_threshold = 1
+    db.breaker.reset_timeout = 3600.0
+    db.breaker.record_failure()
+
+
+def end_outage(db: DiscraftDBConnection):
+    # 다음 요청에서 half-open 상태로 DB를 확인
+    db.breaker.reset_timeout = 0.0
+
+
+async def drain(writer: EconomyWriter):
+    """쓰기 중 시작된 반영 작업이 있으면 기다린 뒤 남은 항목을 반영합니다."""
+    await writer.replay()
+    assert not writer.journal.has_entries()
+
+
+def test_truncated_last_line_is_ignored(tmp_path: Path):
+    journal = WriteJournal(tmp_path / "journal.jsonl")
+    first = JournalEntry(JournalOp.BALANCE_DELTA, USER, 10)
+    journal._append(first.to_json())
+    with journal.path.open("a", encoding="utf-8") as f:
+        f.write(JournalEntry(JournalOp.BALANCE_DELTA, USER, 20).to_json()[:15])
+
+    assert journal.read() == [first]
+
+    # 잘린 줄 뒤에 추가한 항목은 다음 줄에 기록됨
+    second = JournalEntry(JournalOp.CHECK_IN, USER, 30)
+    journal._append(second.to_json())
+    assert journal.read() == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_discard_keeps_other_entries(tmp_path: Path):
+    journal = WriteJournal(tmp_path / "journal.jsonl")
+    entries = [JournalEntry(JournalOp.BALANCE_DELTA, USER, amount) for amount in (1, 2, 3)]
+    for entry in entries:
+        await journal.append(entry)
+
+    await journal.discard(entries[:2])
+    assert journal.read() == entries[2:]
+
+
+@pytest.mark.asyncio
+async def test_write_results(db: DiscraftDBConnection, writer: EconomyWriter):
+    assert await writer.add_balance(USER, 50) is WriteResult.APPLIED
+    assert await writer.add_balance(USER + 1, 50) is WriteResult.NOOP
+
+    assert await writer.check_in(USER, reward=100, timestamp=DAY_1) is WriteResult.APPLIED
+    assert await writer.check_in(USER, reward=100, timestamp=DAY_1 + 60) is WriteResult.NOOP
+
+    assert await balance(db) == 150
+    assert not writer.journal.has_entries()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_journaled_during_outage_and_replayed(db: DiscraftDBConnection, writer: EconomyWriter):
+    start_outage(db)
+    assert await writer.add_balance(USER, 30) is WriteResult.JOURNALED
+    assert await writer.check_in(USER, reward=100, timestamp=DAY_1) is WriteResult.JOURNALED
+    assert len(writer.journal.read()) == 2
+
+    end_outage(db)
+    await drain(writer)
+    assert await balance(db) == 130
+    assert not writer.journal.has_entries()
+
+
+@pytest.mark.asyncio
+async def test_writes_after_recovery_wait_for_journaled_writes(db: DiscraftDBConnection, writer: EconomyWriter):
+    start_outage(db)
+    assert await writer.check_in(USER, reward=100, timestamp=DAY_1) is WriteResult.JOURNALED
+
+    # 앞선 출석체크가 반영되기 전에 다음 주기의 출석체크를 바로 반영하면 앞선 출석체크가 무시됨
+    end_outage(db)
+    assert await writer.check_in(USER, reward=100, timestamp=DAY_2) is WriteResult.JOURNALED
+
+    await drain(writer)
+    assert await balance(db) == 200
+    assert await writer.add_balance(USER, 1) is WriteResult.APPLIED
+
+
+@pytest.mark.asyncio
+async def test_replayed_entry_is_not_applied_twice(db: DiscraftDBConnection, writer: EconomyWriter):
+    start_outage(db)
+    await writer.add_balance(USER, 30)
+    entries = writer.journal.read()
+
+    end_outage(db)
+    await drain(writer)
+
+    # journal에서 삭제하기 전에 프로세스가 종료된 경우
+    for entry in entries:
+        await writer.journal.append(entry)
+    await drain(writer)
+    assert await balance(db) == 30
+
+
+@pytest.mark.asyncio
+async def test_failing_entry_is_moved_to_dead_letter(
+    db: DiscraftDBConnection,
+    writer: EconomyWriter,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    start_outage(db)
+    await writer.add_balance(USER, -1)
+    await writer.add_balance(USER, 30)
+    poison = writer.journal.read()[0]
+
+    apply_entry = journal_module.apply_entry
+
+    async def failing_apply(session, entry, **kwargs):
+        if entry.entry_id == poison.entry_id:
+            raise ValueError("cannot apply")
+        return await apply_entry(session, entry, **kwargs)
+
+    monkeypatch.setattr(journal_module, "apply_entry", failing_apply)
+    end_outage(db)
+    for _ in range(EconomyWriter.MAX_REPLAY_ATTEMPTS):
+        await writer.replay()
+
+    assert await balance(db) == 30
+    assert not writer.journal.has_entries()
+    assert writer.dead_letter.read() == [poison]
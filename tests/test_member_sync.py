@@ -0,0 +1,67 @@
+"""`MemberSyncPipeline`이 DB에 batch를 반영하는 과정을 로컬 SQLite 파일로 확인합니다."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from src.classes.member_sync import MemberSyncPipeline, SyncOp
+from src.database import DiscraftDBConnection, DatabaseUnavailableError, UserInfo
+from src.database.repositories import UserRepository
+
+from .conftest import DatabaseFactory
+
+
+@pytest_asyncio.fixture
+async def db(make_database: DatabaseFactory) -> DiscraftDBConnection:
+    return await make_database()
+
+
+def make_pipeline(db: DiscraftDBConnection) -> MemberSyncPipeline:
+    bot = SimpleNamespace(database=db, guilds=[])
+    return MemberSyncPipeline(bot, retry_delay=0.01, max_retry_delay=0.01) # type: ignore[arg-type]
+
+
+async def stored_ids(db: DiscraftDBConnection) -> list[int]:
+    async with db.session_scope(read_only=True) as session:
+        return list(await UserRepository(session).get_ids_after(0))
+
+
+@pytest.mark.asyncio
+async def test_join_tolerates_users_added_concurrently(db: DiscraftDBConnection, monkeypatch: pytest.MonkeyPatch):
+    async with db.session_scope() as session:
+        UserRepository(session).add(UserInfo(discord_user_id=2))
+
+    # 조회 이후 다른 곳에서 사용자 2를 먼저 추가한 상황
+    async def get_many(self, entity_ids):
+        return []
+
+    monkeypatch.setattr(UserRepository, "get_many", get_many)
+    await make_pipeline(db)._apply(SyncOp.JOIN, [1, 2, 3])
+
+    assert await stored_ids(db) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_retried_after_database_outage(db: DiscraftDBConnection, monkeypatch: pytest.MonkeyPatch):
+    pipeline = make_pipeline(db)
+    apply = pipeline._apply
+    failures = 2
+
+    async def flaky_apply(op, user_ids):
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise DatabaseUnavailableError()
+        await apply(op, user_ids)
+
+    monkeypatch.setattr(pipeline, "_apply", flaky_apply)
+    pipeline.start()
+    try:
+        await pipeline.submit_join([1, 2])
+        await pipeline.submit_remove([1])
+        async with asyncio.timeout(5):
+            while failures or not pipeline._queue.empty() or await stored_ids(db) != [2]:
+                await asyncio.sleep(0.01)
+    finally:
+        await pipeline.stop()
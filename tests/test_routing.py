@@ -0,0 +1,87 @@
+"""primary와 복제본을 두 개의 로컬 SQLite 파일로 구성하여 읽기 전용 세션 라우팅을 확인합니다.
+
+primary에는 사용자 1, 복제본에는 사용자 2만 저장하여 어느 DB에서 읽었는지 구분합니다.
+"""
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import OperationalError
+
+from src.database import DiscraftDBConnection, UserInfo
+from src.database.repositories import UserRepository
+
+from .conftest import DatabaseFactory, create_tables, sqlite_url
+
+PRIMARY_USER = 1
+REPLICA_USER = 2
+
+
+async def read_source(db: DiscraftDBConnection, user_id: int | None = None) -> str:
+    async with db.session_scope(read_only=True, user_id=user_id) as session:
+        ids = await UserRepository(session).get_ids_after(0)
+    return "replica" if REPLICA_USER in ids else "primary"
+
+
+@pytest_asyncio.fixture
+async def replica_path(tmp_path: Path) -> Path:
+    path = tmp_path / "replica.db"
+    await create_tables(sqlite_url(path))
+    return path
+
+
+@pytest_asyncio.fixture
+async def db(make_database: DatabaseFactory, replica_path: Path) -> DiscraftDBConnection:
+    db = await make_database(replica_urls=[sqlite_url(replica_path)], max_replica_lag=5.0)
+    async with db.session_scope() as session:
+        UserRepository(session).add(UserInfo(discord_user_id=PRIMARY_USER))
+
+    replica = db.router.replicas[0].engine
+    async with db.session_factory(bind=replica) as session:
+        UserRepository(session).add(UserInfo(discord_user_id=REPLICA_USER))
+        await session.commit()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_reads_use_primary_until_lag_is_known(db: DiscraftDBConnection):
+    assert await read_source(db) == "primary"
+
+    await db.router.refresh_lag()
+    assert await read_source(db) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_is_skipped(db: DiscraftDBConnection):
+    async def lagging(engine):
+        return 30.0
+
+    db.router.lag_probe = lagging
+    await db.router.refresh_lag()
+    assert await read_source(db) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_stick_to_primary(db: DiscraftDBConnection):
+    await db.router.refresh_lag()
+
+    async with db.session_scope(user_id=PRIMARY_USER) as session:
+        await UserRepository(session).get_by_id(PRIMARY_USER)
+
+    assert await read_source(db, user_id=PRIMARY_USER) == "primary"
+    assert await read_source(db, user_id=3) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary(db: DiscraftDBConnection, replica_path: Path):
+    await db.router.refresh_lag()
+    assert await read_source(db) == "replica"
+
+    # 복제본 파일을 삭제하여 새 커넥션이 테이블이 없는 빈 DB에 연결되도록 함
+    await db.router.replicas[0].engine.dispose()
+    replica_path.unlink()
+
+    with pytest.raises(OperationalError):
+        await read_source(db)
+    assert db.router.replicas[0].lag is None
+    assert await read_source(db) == "primary"